@@ -0,0 +1,75 @@
+"""
+Benchmark: linhas/s gravadas pelo PesagemRepository com COPY binário
+(copy_records_to_table) e com executemany, para lotes de 50 a 50.000 linhas.
+
+Usa o DATABASE_URL do settings.toml (ou --dsn) e grava em uma tabela própria
+(pesagens_bench), com a mesma estrutura de `pesagens`, removida ao final.
+
+Uso:
+    poetry run python benchmarks/bulk_insert.py --batches 50 500 5000 50000 --rows 100000
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import asyncpg
+
+from supervisorio.core.config import settings
+from supervisorio.infrastructure.database.repositories import PesagemRepository
+
+
+class BenchRepository(PesagemRepository):
+    table = 'pesagens_bench'
+
+
+def records(count: int) -> list[tuple]:
+    now = datetime.now(timezone.utc)
+    return [(str(i % 50 + 1), 500 + i % 50, i % 3, now) for i in range(count)]
+
+
+async def measure(conn, mode: str, batch_size: int, rows: int) -> float:
+    await conn.execute(f"TRUNCATE {BenchRepository.table}")
+    batch = records(batch_size)
+    batches = max(1, rows // batch_size)
+
+    start = time.perf_counter()
+    for _ in range(batches):
+        await BenchRepository.write(conn, batch, mode=mode)
+    elapsed = time.perf_counter() - start
+
+    return batches * batch_size / elapsed
+
+
+async def run(args: argparse.Namespace):
+    conn = await asyncpg.connect(args.dsn)
+    try:
+        await conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {BenchRepository.table}
+            (LIKE pesagens INCLUDING DEFAULTS INCLUDING INDEXES)""")
+
+        print(f"{'lote':>8} {'copy (linhas/s)':>16} {'executemany (linhas/s)':>23} {'ganho':>7}")
+        for batch_size in args.batches:
+            rows = max(args.rows, batch_size)
+            copy = await measure(conn, 'copy', batch_size, rows)
+            executemany = await measure(conn, 'executemany', batch_size, rows)
+            print(f"{batch_size:>8} {copy:>16.0f} {executemany:>23.0f} {copy / executemany:>6.1f}x")
+    finally:
+        await conn.execute(f"DROP TABLE IF EXISTS {BenchRepository.table}")
+        await conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", default=settings['global']['DATABASE_URL'])
+    parser.add_argument("--batches", type=int, nargs="+", default=[50, 500, 5_000, 50_000])
+    parser.add_argument("--rows", type=int, default=100_000,
+                        help="Linhas gravadas por medição")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
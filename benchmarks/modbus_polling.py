@@ -0,0 +1,94 @@
+"""
+Benchmark: leituras/s agregadas do coletor conforme cresce o número de CheckWeighers.
+
+Sobe o simulador Modbus em um processo separado (um servidor por equipamento)
+e executa os listeners reais do CheckWeigher contra ele. Os primeiros
+`--slow` equipamentos respondem com atraso, evidenciando que um CW lento
+não bloqueia a leitura dos demais.
+
+Uso:
+    poetry run python benchmarks/modbus_polling.py --devices 1 10 50 100 200 --duration 5
+"""
+import argparse
+import asyncio
+import multiprocessing
+import time
+
+from supervisorio.core.logger import get_logger
+from supervisorio.infrastructure.CW import CheckWeigher
+from supervisorio.simulator.server import (DEFAULT_BASE_PORT, DEFAULT_HOST,
+                                           DeviceProfile, SimulatedCheckWeigher, serve)
+
+logger = get_logger(__name__)
+
+
+def run_simulator(count: int, slow: int, slow_delay: float, base_port: int):
+    slow_profile = DeviceProfile(slow_rate=1.0, slow_delay=slow_delay)
+    devices = [SimulatedCheckWeigher(i + 1, slow_profile if i < slow else None)
+               for i in range(count)]
+    asyncio.run(serve(devices, DEFAULT_HOST, base_port))
+
+
+async def measure(count: int, slow: int, poll_interval: float, duration: float, base_port: int):
+    cws = [CheckWeigher(name=f"SIM{i + 1}", ip_address=DEFAULT_HOST, port=base_port + i,
+                        cw_id=str(i + 1), poll_interval=poll_interval, timeout=1.0,
+                        logger=logger)
+           for i in range(count)]
+
+    # Aquecimento: estabelece as conexões antes de medir
+    await asyncio.gather(*(cw.connect() for cw in cws))
+
+    tasks = [asyncio.create_task(cw.listener()) for cw in cws]
+    start = time.perf_counter()
+    await asyncio.sleep(duration)
+    elapsed = time.perf_counter() - start
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    for cw in cws:
+        cw.close()
+
+    healthy = cws[slow:]
+    reads = sum(cw.metrics.reads_success for cw in healthy)
+    latency = sum(cw.metrics.latency for cw in healthy) / max(len(healthy), 1)
+    return reads / elapsed, latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, nargs="+",
+                        default=[1, 10, 50, 100, 200])
+    parser.add_argument("--poll-interval", type=float, default=0.1)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--slow", type=int, default=1,
+                        help="Quantidade de CWs que respondem com atraso")
+    parser.add_argument("--slow-delay", type=float, default=0.8)
+    parser.add_argument("--base-port", type=int, default=DEFAULT_BASE_PORT)
+    args = parser.parse_args()
+
+    simulator = multiprocessing.Process(
+        target=run_simulator,
+        args=(max(args.devices) + args.slow, args.slow,
+              args.slow_delay, args.base_port),
+        daemon=True)
+    simulator.start()
+    time.sleep(2)  # aguarda os servidores abrirem as portas
+
+    print(f"{'CWs':>6} {'leituras/s':>12} {'ideal':>10} {'eficiência':>11} {'latência média':>15}")
+    try:
+        for count in args.devices:
+            rate, latency = asyncio.run(
+                measure(count + args.slow, args.slow, args.poll_interval,
+                        args.duration, args.base_port))
+            ideal = count / args.poll_interval
+            print(f"{count:>6} {rate:>12.1f} {ideal:>10.1f} {rate / ideal:>10.0%} "
+                  f"{latency * 1000:>12.2f} ms")
+    finally:
+        simulator.terminate()
+        simulator.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: memória por leitura bufferizada e custo de conversão do lote.
+
+Compara o ModbusReadPayload anterior (dataclass com __dict__ por instância)
+com o atual (dataclass com __slots__), medindo a memória de um Buffer cheio
+(10.000 itens) e o tempo de conversão do lote em linhas para o insert_many
+(a mesma list comprehension do PesagemRepository).
+
+Uso:
+    poetry run python benchmarks/payload_memory.py --items 10000
+"""
+import argparse
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from supervisorio.core.types.ModbusReadPayload import ModbusReadPayload
+
+
+@dataclass
+class LegacyModbusReadPayload:
+    cw_id: str
+    weight: int
+    operation_type: int
+    classification: int
+    reason: int
+    ppm: int
+    operation_id: int
+    timestamp: datetime
+    extras: dict[str, Any] | None = None
+
+
+def build(cls, items: int):
+    now = datetime.now()
+    return [cls("1", 500 + i % 50, 1, i % 3, 0, 60, i, now) for i in range(items)]
+
+
+def memory_per_item(cls, items: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    batch = build(cls, items)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del batch
+    return used / items
+
+
+def rows(batch):
+    return [(i.cw_id, i.weight, i.classification, i.timestamp) for i in batch]
+
+
+def conversion_time(convert, batch, repeat: int = 50) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        convert(batch)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'payload':>10} {'bytes/leitura':>14} {'conversão do lote':>18}")
+    for name, cls in (("antes", LegacyModbusReadPayload), ("depois", ModbusReadPayload)):
+        memory = memory_per_item(cls, args.items)
+        elapsed = conversion_time(rows, build(cls, args.items))
+        print(f"{name:>10} {memory:>14.0f} {elapsed * 1000:>15.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Microbenchmark: custo por leitura quando o bloco de registradores não muda.
+
+Compara o caminho antigo (decodifica e cria um ModbusReadPayload a cada
+leitura) com o caminho rápido de CheckWeigher.poll, que compara os
+registradores brutos com a leitura anterior. Reporta o tempo por leitura e a
+memória alocada de forma transitória por leitura (pico do tracemalloc). A linha
+"base" é uma corrotina vazia: o piso de alocação do próprio await.
+
+Uso:
+    poetry run python benchmarks/poll_allocations.py --polls 100000
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from supervisorio.core.logger import get_logger
+from supervisorio.infrastructure.CW import CheckWeigher
+
+logger = get_logger(__name__)
+
+REGISTERS = [1, 520, 2, 60, 0, 0, 0, 0, 0, 0, 42]
+
+
+async def baseline(cw: CheckWeigher, blocks):
+    return 0
+
+
+async def legacy(cw: CheckWeigher, blocks):
+    # Caminho anterior: decodificação + payload + datetime.now() em toda leitura
+    return await cw.process(cw.dumps(blocks))
+
+
+async def fast(cw: CheckWeigher, blocks):
+    # Mesmo fluxo de CheckWeigher.poll após a leitura
+    if cw.unchanged(blocks):
+        return 0
+    return await cw.process(cw.dumps(blocks))
+
+
+async def measure(step, polls: int):
+    cw = CheckWeigher("BENCH", "127.0.0.1", 502, "1", logger=logger)
+    # Cada leitura do pymodbus entrega uma lista nova: pré-aloca fora da medição
+    reads = [[list(REGISTERS)] for _ in range(polls)]
+    await step(cw, reads[0])
+
+    start = time.perf_counter_ns()
+    for blocks in reads:
+        await step(cw, blocks)
+    elapsed = time.perf_counter_ns() - start
+
+    tracemalloc.start()
+    peak = 0
+    for blocks in reads[:1000]:
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        await step(cw, blocks)
+        peak += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+
+    return elapsed / polls, peak / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--polls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'caminho':>10} {'ns/leitura':>12} {'bytes/leitura':>14}")
+    for name, step in (("base", baseline), ("antes", legacy), ("depois", fast)):
+        ns, allocated = asyncio.run(measure(step, args.polls))
+        print(f"{name:>10} {ns:>12.0f} {allocated:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
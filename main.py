@@ -1,8 +1,10 @@
 import asyncio
 from supervisorio.core.buffer import Buffer
-from supervisorio.infrastructure.database.repositories import PesagemRepository, EventRepository
+from supervisorio.infrastructure.database.repositories import (PesagemRepository, EventRepository,
+                                                               RepositoryBase)
 from supervisorio.infrastructure.database.connection import get_pool, close_pool
 from supervisorio.services.worker import worker
+from supervisorio.services.scheduler import PollScheduler
 from supervisorio.infrastructure.CW import CheckWeigher
 from supervisorio.core.logger import get_logger
 from supervisorio.core.config import settings
@@ -37,16 +39,26 @@ async def shutdown(loop):
     logger.info("Shutdown finalizado com sucesso.")
 
 
-async def main():
+async def main(shard: int = 0, shards: int = 1):
+    """
+    Executa o coletor para uma fatia (shard) dos CheckWeighers habilitados.
+
+    :param shard: Índice da fatia atendida por este processo
+    :param shards: Total de processos coletores
+    """
     logger = get_logger("collector", 'collector.log')
-    logger.info("Iniciando aplicação de pesagem...")
+    logger.info(f"Iniciando aplicação de pesagem (shard {shard + 1}/{shards})...")
 
     # 1. Inicializa o Buffer (Fila em memória)
-    # Recomendado maxsize para evitar estouro de memória se o banco cair
-    buffer_pesagens = Buffer[ModbusReadPayload](maxsize=10_000)
-    buffer_eventos = Buffer(maxsize=10_000)
+    # Recomendado maxsize para evitar estouro de memória se o banco cair;
+    # com spool habilitado o excedente vai para o disco (um spool por shard)
+    buffer_pesagens = Buffer[ModbusReadPayload](
+        maxsize=10_000, spool=settings.spool(f"pesagens-{shard}"))
+    buffer_eventos = Buffer(
+        maxsize=10_000, spool=settings.spool(f"eventos-{shard}"))
 
     # 2. Inicializa o Pool de Conexões e o Banco de Dados
+    RepositoryBase.insert_mode = settings.insert_mode
     await get_pool()
     await PesagemRepository.initialize()
     await EventRepository.initialize()
@@ -56,43 +68,53 @@ async def main():
     worker_pesagem_task = asyncio.create_task(
         worker(buffer=buffer_pesagens,
                repository=PesagemRepository,
-               worker_name='pesagens'
+               worker_name='pesagens',
+               controller=settings.batch_controller(),
+               writers=settings.writers
                ),
         name="Worker-pesagem-task"
     )
     worker_event_task = asyncio.create_task(
         worker(buffer=buffer_eventos,
                repository=EventRepository,
-               worker_name='Eventos'
+               worker_name='Eventos',
+               controller=settings.batch_controller(),
+               writers=settings.writers
                ),
         name='Worker-eventos-task'
     )
 
+    # Distribuição round-robin dos equipamentos habilitados entre os processos
+    enabled = [cw for cw in settings.cws if cw.enabled]
+
     # Instanciação e atribuição dos eventos
     cws = [cw
            .on(CheckWeigher.eventTypes.WEIGHT_READ, buffer_pesagens.put)
            .on(CheckWeigher.eventTypes.EVENT_CHANGED,  buffer_eventos.put)
            .on(CheckWeigher.eventTypes.ERROR, logger.error)
-           for cw in settings.cws if cw.enabled]
+           for cw in enabled[shard::shards]]
 
-    # Cria tarefas async que monitoram os equipamentos
-    tasks = [asyncio.create_task(
-        cw.listener(), name=f"{cw.name} listener") for cw in cws]
+    # Agendador central: dispara as leituras de todos os equipamentos por deadline
+    scheduler_task = asyncio.create_task(
+        PollScheduler(cws).run(), name="poll-scheduler")
 
     # 4. Monitoramento e Graceful Shutdown
     loop = asyncio.get_running_loop()
 
     try:
         # Mantém o main vivo enquanto as tasks rodam
-        await asyncio.gather(worker_pesagem_task, worker_event_task, * tasks)
+        await asyncio.gather(worker_pesagem_task, worker_event_task, scheduler_task)
     except asyncio.CancelledError:
         logger.info("Aplicação encerrada.")
 
     except Exception as e:
         logger.exception(e)
+        raise  # Propaga a falha para que o supervisor reinicie o processo
 
     finally:
         await shutdown(loop)
+        buffer_pesagens.close()
+        buffer_eventos.close()
 
 
 if __name__ == "__main__":
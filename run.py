@@ -1,23 +1,27 @@
+import sys
 import uvicorn
 import asyncio
 import multiprocessing
 from supervisorio.core.config import settings
 from supervisorio.core.logger import get_logger
+from supervisorio.services.supervisor import ProcessSupervisor
 
 from api import app as fastapi_app
 from main import main as start_collector
 
 
-def run_modbus_observer():
+def run_modbus_observer(shard: int = 0, shards: int = 1):
     """Executa o motor de coleta Modbus diretamente via função."""
     logger = get_logger("collector", 'collector.log')
-    logger.info("Iniciando Coletor Modbus...")
+    logger.info(f"Iniciando Coletor Modbus (shard {shard + 1}/{shards})...")
     try:
-        asyncio.run(start_collector())
+        asyncio.run(start_collector(shard, shards))
     except KeyboardInterrupt:
         pass
     except Exception as e:
         logger.error(f"Erro no Coletor Modbus: {e}")
+        # Código de saída != 0 sinaliza ao supervisor que o processo deve ser reiniciado
+        sys.exit(1)
 
 
 def run_fastapi_api():
@@ -33,6 +37,7 @@ def run_fastapi_api():
         )
     except Exception as e:
         logger.error(f"Erro ao iniciar o servidor API: {e}")
+        sys.exit(1)
 
 
 def main():
@@ -41,29 +46,27 @@ def main():
     logger.info("SUPERVISÓRIO DE PROCESSOS - INICIANDO")
     logger.info("="*40)
 
-    modbus_process = multiprocessing.Process(
-        target=run_modbus_observer, name="ModbusWorker")
-    api_process = multiprocessing.Process(
-        target=run_fastapi_api, name="ApiWorker")
+    shards = settings.collector_processes
+    supervisor = ProcessSupervisor()
+
+    for shard in range(shards):
+        supervisor.add(f"ModbusWorker-{shard + 1}",
+                       run_modbus_observer, (shard, shards))
+    supervisor.add("ApiWorker", run_fastapi_api)
 
     try:
-        modbus_process.start()
-        api_process.start()
+        supervisor.start()
 
-        logger.info(f"Coletor Modbus iniciado [PID {modbus_process.pid}]")
+        logger.info(f"Coletor Modbus iniciado em {shards} processo(s)")
         logger.info(
-            f"API Gateway iniciada [PID {api_process.pid}] na porta {settings['api']['port']}")
+            f"API Gateway iniciada na porta {settings['api']['port']}")
 
-        # Mantém o script pai vivo
-        modbus_process.join()
-        api_process.join()
+        # Mantém o script pai vivo, reiniciando processos que falharem
+        supervisor.watch()
 
     except KeyboardInterrupt:
         logger.error("Encerrando sistema (Ctrl+C detectado)...")
-        modbus_process.terminate()
-        api_process.terminate()
-        modbus_process.join()
-        api_process.join()
+        supervisor.stop()
         logger.info("Todos os serviços foram interrompidos.")
 
 
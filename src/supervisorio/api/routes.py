@@ -66,7 +66,7 @@ async def health_check():
 @router.get('/realtime/{cw_name}')
 async def realtime(cw_name: str):
     target = settings.get_cw_by_name(cw_name)
-    return target.payload if target is not None else None
+    return target.realtime if target is not None else None
 
 
 @router.get("/hhh")
@@ -83,6 +83,11 @@ async def get_system_health():
             "buffer_usage": info.buffer_usage,
             "total_processed": info.total_processed,
             "errors": info.error_count,
+            "batch_size": info.batch_size,
+            "linger": info.linger,
+            "insert_latency": info.insert_latency,
+            "in_flight": info.in_flight,
+            "pending_acks": info.pending_acks,
             "uptime_relativo": f"{int(current_time - info.last_heartbeat)}s atrás"
         }
 
@@ -1,41 +1,162 @@
 import asyncio
+from collections import deque
 from typing import Generic, TypeVar, List
 
+from supervisorio.core.spool import DiskSpool
+
 T = TypeVar('T')
 
 
 class Buffer(Generic[T]):
-    def __init__(self, maxsize: int = 10_000) -> None:
+    def __init__(self, maxsize: int = 10_000, spool: DiskSpool[T] | None = None) -> None:
+        """
+        :param maxsize: Capacidade da fila em memória
+        :param spool: Spool em disco que recebe o excedente quando a fila enche.
+            Sem spool, `put` aguarda espaço na fila.
+        """
         # Usamos o Queue nativo do asyncio para evitar bloqueio do event loop
         self._queue: asyncio.Queue[T] = asyncio.Queue(maxsize=maxsize)
+        self._spool = spool
+        # Lotes entregues e ainda não confirmados, na ordem de entrega:
+        # posição no spool (lote do disco) ou None (lote da memória)
+        self._delivered: deque[tuple[int, int] | None] = deque()
+        self._hold_commits = False
+        # Enquanto houver itens no spool, os novos também vão para o disco (mantém a ordem)
+        self._spilling = bool(spool and spool.pending)
+        self._wakeup = asyncio.Event()
+        self._carry: List[T] = []  # itens de um get_batch cancelado durante o linger
 
     async def put(self, item: T) -> None:
         """Adiciona um item ao buffer de forma assíncrona."""
-        await self._queue.put(item)
+        if self._spool is not None and (self._spilling or self._queue.full()):
+            self._spilling = True
+            self._spool.append(item)
+        else:
+            await self._queue.put(item)
+
+        if self._spool is not None:
+            self._wakeup.set()
+
+    def spill(self, items: List[T]) -> None:
+        """Grava os itens diretamente no spool (ex.: lote não persistido no desligamento)"""
+        if self._spool is None:
+            raise RuntimeError('Buffer sem spool em disco')
+        self._spilling = True
+        self._spool.append_many(items)
+        self._wakeup.set()
+
+    def reject(self, items: List[T]) -> bool:
+        """
+        Devolve ao disco o lote entregue mais antigo, não persistido (ex.: desligamento
+        com o banco fora). Lotes vindos do spool permanecem nele e são reproduzidos na
+        próxima execução.
+
+        :return: False se o buffer não possui spool (o lote será perdido)
+        """
+        if self._spool is None:
+            return False
+        position = self._delivered.popleft() if self._delivered else None
+        if position is not None:
+            # O cursor não pode mais avançar além deste lote
+            self._hold_commits = True
+        else:
+            self.spill(items)
+        return True
+
+    def ack(self) -> None:
+        """
+        Confirma como persistido o lote entregue mais antigo por `get_batch`.
+        Com vários consumidores, os lotes devem ser confirmados na ordem de entrega.
+        """
+        if self._spool is None or not self._delivered:
+            return
+        position = self._delivered.popleft()
+        if position is not None and not self._hold_commits:
+            self._spool.commit(position)
 
-    async def get_batch(self, batch_size: int = 500) -> List[T]:
+    async def get_batch(self, batch_size: int = 500, linger: float = 0.0) -> List[T]:
         """
         Extrai um lote de itens de forma extremamente rápida.
         Se a fila estiver vazia, aguarda o primeiro item chegar.
+
+        Com `linger`, após o primeiro item aguarda até esse tempo (s) por mais
+        itens, retornando assim que o lote atingir `batch_size`.
+
+        Com spool, a fila em memória (itens mais antigos) é esvaziada primeiro
+        e depois o spool é reproduzido em ordem. Lotes vindos do spool só são
+        descartados do disco após `ack`.
         """
         result = []
 
-        # Aguarda o primeiro item para não retornar uma lista vazia (bloqueio eficiente)
-        first_item = await self._queue.get()
-        result.append(first_item)
+        if self._spool is not None:
+            while self._queue.empty() and not self._carry:
+                if self._spool.pending:
+                    result, position = self._spool.read(batch_size)
+                    self._delivered.append(position)
+                    return result
+                # Spool totalmente lido: novos itens voltam para a memória
+                self._spilling = False
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+        if self._carry:
+            # Itens já retirados da fila por um get_batch cancelado
+            result, self._carry = self._carry, []
+        else:
+            # Aguarda o primeiro item para não retornar uma lista vazia (bloqueio eficiente)
+            first_item = await self._queue.get()
+            result.append(first_item)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + linger
+
+        while True:
+            # Tenta pegar o restante do batch de forma não-bloqueante (imediata)
+            while len(result) < batch_size:
+                try:
+                    # get_nowait() é muito mais rápido que get() dentro de um loop
+                    result.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            remaining = deadline - loop.time()
+            if len(result) >= batch_size or remaining <= 0:
+                break
 
-        # Tenta pegar o restante do batch de forma não-bloqueante (imediata)
-        while len(result) < batch_size:
             try:
-                # get_nowait() é muito mais rápido que get() dentro de um loop
-                result.append(self._queue.get_nowait())
-            except asyncio.QueueEmpty:
+                result.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
                 break
+            except asyncio.CancelledError:
+                # Não perde o que já saiu da fila: o próximo get_batch (ex.: flush) entrega
+                self._carry = result
+                raise
 
+        if self._spool is not None:
+            self._delivered.append(None)
         return result
 
     def qsize(self) -> int:
-        return self._queue.qsize()
+        return self._queue.qsize() + len(self._carry)
+
+    def spooled(self) -> int:
+        """Itens aguardando no spool em disco"""
+        return self._spool.pending if self._spool is not None else 0
+
+    @property
+    def durable(self) -> bool:
+        return self._spool is not None
+
+    def close(self) -> None:
+        """Fecha o spool, gravando nele o que restou na fila em memória"""
+        if self._spool is None:
+            return
+
+        remaining, self._carry = self._carry, []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        self._spool.append_many(remaining)
+        self._spool.close()
 
 
 if __name__ == '__main__':
@@ -1,8 +1,12 @@
+import os
 import sys
 import toml
 from supervisorio.core.logger import get_logger
-from supervisorio.config.settings import CONFIG_PATH
-from supervisorio.infrastructure.CW import CheckWeigher
+from supervisorio.config.settings import CONFIG_PATH, DATA_PATH
+from supervisorio.core.spool import DiskSpool
+from supervisorio.infrastructure.CW import CheckWeigher, DEFAULT_REGISTER_MAP, PAYLOAD_FIELDS
+from supervisorio.infrastructure.register_map import RegisterMap
+from supervisorio.services.batching import BatchController
 
 logger = get_logger(__name__)
 
@@ -38,9 +42,70 @@ class Settings(metaclass=SingletonMeta):
 
         self._data = toml.load(config_path)
         self.cws = []
+        self.register_maps: dict[str, RegisterMap] = {}
 
+        self.__install_register_maps()
         self.__install_checkeweighers()
 
+    @property
+    def collector_processes(self) -> int:
+        """
+        Total de processos coletores (shards).
+        Padrão: nº de núcleos, limitado ao nº de CheckWeighers habilitados.
+        """
+        enabled = len([cw for cw in self.cws if cw.enabled])
+        configured = self._data["observer"].get("processes") or os.cpu_count() or 1
+        return max(1, min(int(configured), enabled))
+
+    @property
+    def insert_mode(self) -> str:
+        """Modo de gravação dos lotes: 'copy' (padrão) ou 'executemany'"""
+        # Import local: repositories depende deste módulo (connection -> settings)
+        from supervisorio.infrastructure.database.repositories import INSERT_MODES
+
+        mode = self._data["observer"].get("insert_mode", "copy")
+        if mode not in INSERT_MODES:
+            logger.error(f"ERRO: insert_mode '{mode}' inválido. Opções: {INSERT_MODES}")
+            sys.exit(1)
+        return mode
+
+    @property
+    def batch_size(self) -> int:
+        """Máximo de itens por lote enviado ao banco pelos workers (padrão 500)"""
+        size = int(self._data["observer"].get("batch_size", 500))
+        if size < 1:
+            logger.error(f"ERRO: batch_size deve ser maior que zero (recebido {size})")
+            sys.exit(1)
+        return size
+
+    @property
+    def writers(self) -> int:
+        """Inserts simultâneos por buffer (writers); limitado ao pool de conexões"""
+        writers = int(self._data["observer"].get("writers", 1))
+        if not 1 <= writers <= 8:
+            logger.error(f"ERRO: writers deve estar entre 1 e 8 (recebido {writers})")
+            sys.exit(1)
+        return writers
+
+    def batch_controller(self) -> BatchController:
+        """Controlador de lotes de um worker (tamanho máximo, linger e SLO do [observer])"""
+        observer = self._data["observer"]
+        return BatchController(max_size=self.batch_size,
+                               max_linger=float(observer.get("batch_linger", 0.5)),
+                               max_round_trips=float(observer.get("max_inserts_per_second", 10)),
+                               latency_slo=float(observer.get("latency_slo", 2.0)))
+
+    def spool(self, name: str) -> DiskSpool | None:
+        """
+        Spool em disco (data/spool/<name>) para o excedente de um buffer.
+        Retorna None se `[observer] spool` não estiver habilitado.
+        """
+        observer = self._data["observer"]
+        if not observer.get("spool", False):
+            return None
+        segment_size = int(observer.get("spool_segment_mb", 64)) * 1024 * 1024
+        return DiskSpool(DATA_PATH / "spool" / name, segment_size=segment_size)
+
     def get_cw_by_name(self, cw_name):
         target = None
         for cw in self.cws:
@@ -50,6 +115,26 @@ class Settings(metaclass=SingletonMeta):
 
         return target
 
+    def __install_register_maps(self):
+        """Compila, uma única vez, os mapas de registradores de cada modelo"""
+        self.register_maps = {'default': DEFAULT_REGISTER_MAP}
+
+        for model, config in self._data.get("register_maps", {}).items():
+            try:
+                self.register_maps[model] = RegisterMap.from_config(
+                    model, config, output=PAYLOAD_FIELDS)
+            except (KeyError, ValueError) as e:
+                logger.error(f"ERRO: Mapa de registradores '{model}' inválido: {e}")
+                sys.exit(1)
+
+    def __register_map_for(self, args: dict) -> RegisterMap:
+        model = args.get('model', 'default')
+        if model not in self.register_maps:
+            logger.error(
+                f"ERRO: Modelo '{model}' do CW {args['name']} não possui mapa de registradores")
+            sys.exit(1)
+        return self.register_maps[model]
+
     def __install_checkeweighers(self):
         cws_config = self._data["observer"]["checkweighers"]
         self.cws = [CheckWeigher(cw_id=args['cw_id'],
@@ -57,8 +142,11 @@ class Settings(metaclass=SingletonMeta):
                                  ip_address=args['ip_address'],
                                  port=args['port'],
                                  enabled=args['enabled'],
-                                 pool_interval=args.get('pool_interval', None),
-                                 timeout=args.get('timeout', None)
+                                 poll_interval=args.get('poll_interval', None),
+                                 min_poll_interval=args.get('min_poll_interval', None),
+                                 max_poll_interval=args.get('max_poll_interval', None),
+                                 timeout=args.get('timeout', None),
+                                 register_map=self.__register_map_for(args)
                                  )
                     for args in cws_config]
 
@@ -10,6 +10,11 @@ class ComponentStatus:
     buffer_usage: int = 0
     total_processed: int = 0
     error_count: int = 0
+    batch_size: int = 0          # lote alvo do worker
+    linger: float = 0.0          # espera por mais itens antes do insert (s)
+    insert_latency: float = 0.0  # duração do último insert (s)
+    in_flight: int = 0           # lotes com insert em andamento
+    pending_acks: int = 0        # lotes gravados aguardando a confirmação de anteriores
 
 
 class SystemMonitor:
@@ -25,13 +30,26 @@ class SystemMonitor:
             }
         return cls._instance
 
-    def update_heartbeat(self, component_name: str, buffer_size: int = 0, increment_processed: int = 0):
+    def update_heartbeat(self, component_name: str, buffer_size: int = 0, increment_processed: int = 0,
+                         batch_size: int | None = None, linger: float | None = None,
+                         insert_latency: float | None = None, in_flight: int | None = None,
+                         pending_acks: int | None = None):
         if component_name in self.components:  # type: ignore
             comp = self.components[component_name]  # type: ignore
             comp.status = "online"
             comp.last_heartbeat = time.time()
             comp.buffer_usage = buffer_size
             comp.total_processed += increment_processed
+            if batch_size is not None:
+                comp.batch_size = batch_size
+            if linger is not None:
+                comp.linger = linger
+            if insert_latency is not None:
+                comp.insert_latency = insert_latency
+            if in_flight is not None:
+                comp.in_flight = in_flight
+            if pending_acks is not None:
+                comp.pending_acks = pending_acks
 
     def report_error(self, component_name: str):
         if component_name in self.components:  # type: ignore
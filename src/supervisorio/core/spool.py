@@ -0,0 +1,201 @@
+import mmap
+import os
+import pathlib
+import pickle
+import struct
+import zlib
+from typing import Generic, List, TypeVar
+
+from supervisorio.core.logger import get_logger
+
+logger = get_logger(__name__)
+T = TypeVar('T')
+
+# Cabeçalho de cada registro: tamanho do payload e crc32
+RECORD_HEADER = struct.Struct('<II')
+SEGMENT_SUFFIX = '.spool'
+CURSOR_FILE = 'cursor'
+
+
+class DiskSpool(Generic[T]):
+    """
+    Fila persistente em disco, somente-anexação, dividida em segmentos.
+
+    Os itens são gravados em arquivos `<seq>.spool` como registros
+    [tamanho][crc32][pickle]. A leitura é feita por mmap e a posição confirmada
+    (`commit`) é salva em `cursor` de forma atômica; segmentos já consumidos
+    são removidos. Ao reabrir, um registro incompleto no fim do último segmento
+    (processo morto no meio da escrita) é descartado e a leitura continua do
+    último cursor confirmado: a entrega é pelo menos uma vez, em ordem.
+    """
+
+    def __init__(self, path: pathlib.Path | str, segment_size: int = 64 * 1024 * 1024) -> None:
+        """
+        :param path: Diretório do spool (criado se não existir)
+        :param segment_size: Tamanho, em bytes, a partir do qual um novo segmento é iniciado
+        """
+        self.path = pathlib.Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+
+        self._writer = None
+        self._maps: dict[int, mmap.mmap] = {}
+        self.pending = 0  # itens gravados e ainda não lidos
+
+        self.__recover()
+
+    def _segment(self, seq: int) -> pathlib.Path:
+        return self.path / f'{seq:012d}{SEGMENT_SUFFIX}'
+
+    def _segments(self) -> list[int]:
+        return sorted(int(p.stem) for p in self.path.glob(f'*{SEGMENT_SUFFIX}'))
+
+    def __recover(self):
+        segments = self._segments()
+        self._read = self.__load_cursor(segments)
+
+        if segments:
+            last = segments[-1]
+            valid = self.__scan(last, 0)[1]
+            size = self._segment(last).stat().st_size
+            if valid < size:
+                logger.warning(
+                    f'Spool {self.path.name}: registro incompleto descartado '
+                    f'({size - valid} bytes no segmento {last})')
+                os.truncate(self._segment(last), valid)
+
+            for seq in segments:
+                if seq >= self._read[0]:
+                    self.pending += self.__scan(
+                        seq, self._read[1] if seq == self._read[0] else 0)[0]
+
+        self._write_seq = max(segments[-1], self._read[0]) if segments else self._read[0]
+        segment = self._segment(self._write_seq)
+        self._write_size = segment.stat().st_size if segment.exists() else 0
+
+        if self.pending:
+            logger.info(f'Spool {self.path.name}: {self.pending} itens pendentes recuperados')
+
+    def __load_cursor(self, segments: list[int]) -> tuple[int, int]:
+        cursor = self.path / CURSOR_FILE
+        if cursor.exists():
+            seq, offset = cursor.read_text().split()
+            return int(seq), int(offset)
+        return (segments[0] if segments else 0), 0
+
+    def __scan(self, seq: int, offset: int) -> tuple[int, int]:
+        """
+        Percorre os registros íntegros de um segmento.
+
+        :return: (quantidade de registros, offset do fim do último registro íntegro)
+        """
+        data = self._segment(seq).read_bytes()
+        count = 0
+        while offset + RECORD_HEADER.size <= len(data):
+            length, crc = RECORD_HEADER.unpack_from(data, offset)
+            end = offset + RECORD_HEADER.size + length
+            if end > len(data) or zlib.crc32(data[offset + RECORD_HEADER.size:end]) != crc:
+                break
+            count += 1
+            offset = end
+        return count, offset
+
+    def append(self, item: T) -> None:
+        """Grava um item no fim do spool"""
+        self.append_many([item])
+
+    def append_many(self, items: List[T]) -> None:
+        """Grava os itens no fim do spool com uma única escrita"""
+        if not items:
+            return
+
+        if self._writer is None or self._write_size >= self.segment_size:
+            self.__open_writer()
+
+        chunk = bytearray()
+        for item in items:
+            data = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+            chunk += RECORD_HEADER.pack(len(data), zlib.crc32(data))
+            chunk += data
+
+        # Arquivo sem buffer: o registro chega ao SO no próprio write
+        self._writer.write(chunk)  # type: ignore
+        self._write_size += len(chunk)
+        self.pending += len(items)
+
+    def __open_writer(self):
+        """Abre o segmento atual ou, se ele atingiu o tamanho máximo, inicia o próximo"""
+        if self._writer is not None:
+            self._writer.close()
+        if self._write_size >= self.segment_size:
+            self._write_seq += 1
+            self._write_size = 0
+        self._writer = open(self._segment(self._write_seq), 'ab', buffering=0)
+
+    def __map(self, seq: int, needed: int) -> mmap.mmap | None:
+        """mmap do segmento, remapeado quando o arquivo cresceu além do trecho mapeado"""
+        current = self._maps.get(seq)
+        if current is not None and len(current) >= needed:
+            return current
+
+        if current is not None:
+            current.close()
+            del self._maps[seq]
+
+        segment = self._segment(seq)
+        if not segment.exists() or segment.stat().st_size == 0:
+            return None
+
+        with open(segment, 'rb') as f:
+            self._maps[seq] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[seq]
+
+    def read(self, max_items: int = 500) -> tuple[List[T], tuple[int, int]]:
+        """
+        Lê, em ordem, até `max_items` itens ainda não lidos.
+
+        :return: (itens, posição a ser confirmada com `commit` após o processamento)
+        """
+        items: List[T] = []
+        seq, offset = self._read
+
+        while len(items) < max_items and self.pending:
+            data = self.__map(seq, offset + RECORD_HEADER.size)
+            if data is None or offset + RECORD_HEADER.size > len(data):
+                if seq >= self._write_seq:
+                    break
+                seq, offset = seq + 1, 0  # fim do segmento: segue para o próximo
+                continue
+
+            length, _ = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            data = self.__map(seq, start + length)
+            items.append(pickle.loads(data[start:start + length]))  # type: ignore
+            offset = start + length
+            self.pending -= 1
+
+        self._read = (seq, offset)
+        return items, self._read
+
+    def commit(self, position: tuple[int, int]) -> None:
+        """Confirma o processamento até `position`, removendo segmentos consumidos"""
+        seq, offset = position
+        cursor = self.path / CURSOR_FILE
+        tmp = cursor.with_suffix('.tmp')
+        tmp.write_text(f'{seq} {offset}')
+        os.replace(tmp, cursor)
+
+        for old in self._segments():
+            if old >= seq:
+                break
+            if old in self._maps:
+                self._maps.pop(old).close()
+            self._segment(old).unlink()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for data in self._maps.values():
+            data.close()
+        self._maps.clear()
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from supervisorio.core.types.event_types import EventTypes
 
 
-@dataclass
+@dataclass(slots=True)
 class MachineStopEventPayload:
     cw_id: str
     reason: int
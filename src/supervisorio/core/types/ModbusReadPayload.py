@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ModbusReadPayload:
     cw_id: str
     weight: int
@@ -12,3 +13,4 @@ class ModbusReadPayload:
     ppm: int
     operation_id: int
     timestamp: datetime
+    extras: dict[str, Any] | None = None  # campos adicionais do mapa de registradores
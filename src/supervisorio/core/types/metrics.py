@@ -14,6 +14,9 @@ class Metrics:
         self.last_latency: float = 0
         self.latency: float = 0
         self.connected = False
+        self.poll_interval: float = 0      # intervalo de leitura vigente
+        self.deadlines_missed = 0          # ticks do agendador perdidos
+        self.operations_missed = 0         # saltos de operation_id não lidos
         self.started_at = datetime.now()
 
     @property
@@ -1,169 +1,183 @@
 import asyncio
 
+from dataclasses import asdict
 from datetime import datetime
 
-from pymodbus.client import ModbusTcpClient
-from pymodbus.exceptions import ModbusException
-
 from supervisorio.core.logger import get_logger
-from supervisorio.core.types.metrics import Metrics
 from supervisorio.utils.event_manager import EventManager
 from supervisorio.core.types.event_types import EventTypes
 from supervisorio.core.types.ModbusReadPayload import ModbusReadPayload
 from supervisorio.core.types.MachineEventPayload import MachineStopEventPayload
+from supervisorio.infrastructure.modbus_reader import ModbusReader
+from supervisorio.infrastructure.register_map import RegisterField, RegisterMap
 
 
 GAP_ADDRESS = 30720
 SIZE_READ = 11
+MAX_RETRY_DELAY = 30  # segundos entre tentativas com o equipamento offline
+
+# Campos do ModbusReadPayload, na ordem do construtor, lidos do mapa de registradores
+PAYLOAD_FIELDS = ('weight', 'operation_type', 'classification',
+                  'reason', 'ppm', 'operation_id')
 
+# Layout padrão: bloco de 11 registradores a partir de GAP_ADDRESS
+DEFAULT_REGISTER_MAP = RegisterMap('default', [
+    RegisterField('operation_type', GAP_ADDRESS + 0),
+    RegisterField('weight', GAP_ADDRESS + 1),
+    RegisterField('classification', GAP_ADDRESS + 2),
+    RegisterField('ppm', GAP_ADDRESS + 3),
+    RegisterField('reason', GAP_ADDRESS + 7),
+    RegisterField('operation_id', GAP_ADDRESS + 10),
+], output=PAYLOAD_FIELDS)
 
-class CheckWeigher(EventManager):
+
+class CheckWeigher(ModbusReader[ModbusReadPayload], EventManager):
     eventTypes = EventTypes
 
     def __init__(self, name: str, ip_address: str, port: int, cw_id: str, **kwargs):
-        super().__init__()
-        self.name = name
-        self.ip_address = ip_address
-        self.port = port
+        ModbusReader.__init__(self, name, ip_address, port,
+                              timeout=kwargs.get('timeout') or 5.0,
+                              poll_interval=kwargs.get('poll_interval') or 0.1)
+        EventManager.__init__(self)
         self.cw_id = cw_id
 
         self.enabled = kwargs.get('enabled', True)
-        self.timeout = kwargs.get('timeout', 5.0)
-        self.poll_interval = kwargs.get('poll_interval', 0.1)
+        # Limites do intervalo adaptativo usado pelo PollScheduler
+        self.min_poll_interval = kwargs.get('min_poll_interval') or 0.02
+        self.max_poll_interval = kwargs.get('max_poll_interval') or 1.0
+
+        self.register_map: RegisterMap = kwargs.get(
+            'register_map') or DEFAULT_REGISTER_MAP
+        # Nomes dos campos além dos do payload (vão para payload.extras)
+        self._extra_fields = self.register_map.names[len(PAYLOAD_FIELDS):]
 
-        self.metrics = Metrics()
-        self.connected = False
         self.payload: None | ModbusReadPayload = None
+        # Contadores de leituras bem sucedidas: freshness sem datetime por leitura
+        self.seen = 0          # total de leituras completas
+        self.changed_seen = 0  # valor de `seen` na última alteração dos registradores
+        self._last_blocks: list[list[int]] | None = None
         self.event_payload: None | MachineStopEventPayload = None
 
-        self.logger = get_logger(name, f'{name}.log')
-        self.__modbusClient = ModbusTcpClient(ip_address, port=port)
+        # Um arquivo de log por equipamento, salvo se um logger for informado
+        self.logger = kwargs.get('logger') or get_logger(name, f'{name}.log')
 
         self.__last_operation_id = 0    # para controle de transação
         self.__last_operation_type = 0  # para controle de troca de estado
-        self._connect_lock = asyncio.Lock()
+        self.__synced = False           # True após a primeira leitura com operação
 
     @property
-    def realtime(self):
-        """Retorna um payload contendo o último estado lido"""
-        return self.payload
-
-    async def read(self) -> list[int]:
+    def realtime(self) -> dict | None:
         """
-        Faz a leitura dos dados na rede modbus
-
+        Retorna o último estado lido e a sua atualidade.
+        `timestamp` marca a última alteração; `seen` e `unchanged_reads`
+        mostram se o estado continua sendo confirmado pelo equipamento.
         """
-        self.logger.debug(f"[{self.name}] - Leitura na rede modbus iniciada")
-        response = self.__modbusClient.read_holding_registers(
-            address=GAP_ADDRESS, count=SIZE_READ)
-        self.logger.debug(
-            f"[{self.name}] - Leitura na rede modbus terminada - Latencia: {self.metrics.latency}")
+        if self.payload is None:
+            return None
+        return {**asdict(self.payload), 'seen': self.seen,
+                'unchanged_reads': self.unchanged_reads}
 
-        return response.registers
+    @property
+    def unchanged_reads(self) -> int:
+        """
+        Leituras desde a última alteração dos registradores.
+        `payload.timestamp` marca a alteração; este contador indica que o
+        estado continua sendo confirmado pelo equipamento.
+        """
+        return self.seen - self.changed_seen
 
     def dumps(self, data) -> ModbusReadPayload:
         """
-        Interpreta os dados lidos 
+        Interpreta os dados lidos (um item por bloco do mapa de registradores)
 
         """
+        values = self.register_map.decode(data)
 
         self.payload = ModbusReadPayload(
-            cw_id=self.cw_id,
-            operation_type=data[0],
-            weight=data[1],
-            classification=data[2],
-            ppm=data[3],
-            reason=data[7],
-            operation_id=data[10],
-            timestamp=datetime.now()
+            self.cw_id, *values[:6], timestamp=datetime.now(),
+            extras=dict(zip(self._extra_fields, values[6:])) if self._extra_fields else None
         )
 
         return self.payload
 
-    async def listener(self):
-        while self.enabled:
-            try:
-                start = datetime.now()
-                self.metrics.reads_total += 1
+    async def poll(self) -> int | None:
+        """
+        Executa um ciclo de leitura + despacho de eventos.
+        Retorna quantas operações o equipamento avançou desde a leitura
+        anterior (0 = sem alteração) ou None quando o equipamento não respondeu.
+        """
+        blocks = []
+        for block in self.register_map.blocks:
+            response = await self.safe_read(block.address, block.count)
+            if not response:
+                return None
+            blocks.append(response)
 
-                response = await self.safe_read()
+        if self.unchanged(blocks):
+            return 0
 
-                if not response:
-                    raise ModbusException(
-                        "Nenhuma resposta do equipamento")
+        return await self.process(self.dumps(blocks))
 
-                data = self.dumps(response)
+    def unchanged(self, blocks: list[list[int]]) -> bool:
+        """
+        Registra a leitura e indica se os registradores são idênticos aos da
+        leitura anterior. Nesse caso (o mais comum) a leitura é descartada sem
+        decodificação, alocação de payload nem timestamp.
+        """
+        self.seen += 1
+        if blocks == self._last_blocks:
+            return True
 
-                self.metrics.reads_success += 1
-                self.metrics.connected = True
+        self._last_blocks = blocks
+        self.changed_seen = self.seen
+        return False
 
-                self.metrics.latency = (datetime.now() - start).total_seconds()
-                self.metrics.last_latency = self.metrics.latency
+    async def process(self, data: ModbusReadPayload) -> int:
+        """Avalia o payload lido e dispara os eventos de pesagem/troca de estado"""
+        if data.operation_id == self.__last_operation_id:
+            return 0
 
-                if data.operation_id != self.__last_operation_id:  # Verifica se houve troca de transação
-                    if data.operation_type == 1:
-                        # resolve se for pesagem
-                        await self.dispatch(EventTypes.WEIGHT_READ, data)
+        # Saltos maiores que 1 no operation_id indicam operações não lidas
+        advanced = (data.operation_id - self.__last_operation_id) & 0xFFFF
+        if self.__synced and advanced > 1:
+            self.metrics.operations_missed += advanced - 1
+        self.__synced = True
 
-                    if self.__last_operation_type != data.operation_type:
-                        await self.event_change(data)
+        if data.operation_type == 1:
+            # resolve se for pesagem
+            await self.dispatch(EventTypes.WEIGHT_READ, data)
 
-                    # Sincroniza os parâmetros para avaliar alteração
-                    self.__last_operation_type = data.operation_type
-                    self.__last_operation_id = data.operation_id
+        if self.__last_operation_type != data.operation_type:
+            await self.event_change(data)
 
-            except (ModbusException, ConnectionError, OSError, asyncio.TimeoutError) as e:
-                self.metrics.reads_timeout += 1
-                await self.disconnect()
-                await self.reconnect_with_backoff()
-                self.logger.warning(f'{e}')
-                await asyncio.sleep(self.timeout)
+        # Sincroniza os parâmetros para avaliar alteração
+        self.__last_operation_type = data.operation_type
+        self.__last_operation_id = data.operation_id
+        return advanced
 
-            except Exception as e:
-                self.metrics.reads_error += 1
-                await self.dispatch(EventTypes.ERROR, e)
-                await self.disconnect()
-                await self.reconnect_with_backoff()
-                self.logger.warning(f'{e}')
-
-            await asyncio.sleep(self.poll_interval)
-
-    async def connect(self):
-        async with self._connect_lock:
-            if self.connected:
-                return True
-            self.logger.info(f"[{self.name}] Conectando...")
-
-            if self.__modbusClient.connect():
-                self.connected = True
-                self.metrics.connected = True
-                self.logger.info(f"[{self.name}] conectado")
-                return True
-
-    async def disconnect(self):
-        self.logger.info(f"[{self.name}] Desconectado")
-        self.connected = False
-        self.metrics.connected = False
-
-    async def safe_read(self):
-        if not self.connected:
-            await self.connect()
-        else:
-            return await asyncio.wait_for(self.read(), timeout=self.timeout)
-
-    async def reconnect_with_backoff(self):
-        delay = 1
-        max_delay = 30
-
-        while self.enabled and not self.connected:
+    async def listener(self):
+        # Cada equipamento roda em sua própria task e toda a E/S é assíncrona:
+        # um CW lento ou desligado não atrasa a leitura dos demais.
+        delay = self.poll_interval
+
+        while self.enabled:
             try:
-                self.metrics.reconnects_total += 1
-                await self.connect()
+                if await self.poll() is not None:
+                    delay = self.poll_interval
+                else:
+                    # Equipamento indisponível: espaça as tentativas (backoff exponencial)
+                    delay = min(max(delay * 2, 1), MAX_RETRY_DELAY)
+
             except Exception as e:
-                self.logger.exception(
-                    f"[{self.name}] Falha ao reconectar, retry em {delay}s", e)
-                await asyncio.sleep(delay)
-                delay = min(delay * 2, max_delay)
+                self.metrics.reads_error += 1
+                self.logger.warning(f'[{self.name}] {e}')
+                try:
+                    await self.dispatch(EventTypes.ERROR, e)
+                except Exception as handler_error:
+                    self.logger.error(
+                        f'[{self.name}] Falha no tratamento do erro: {handler_error}')
+
+            await asyncio.sleep(delay)
 
     async def event_change(self, data: ModbusReadPayload):
         if self.event_payload is not None:
@@ -1,7 +1,8 @@
 from typing import TypeVar, Generic, List, Optional, Dict, Any
 from datetime import date
 from abc import ABC, abstractmethod
-from asyncpg.exceptions import UniqueViolationError
+from asyncpg.exceptions import (FeatureNotSupportedError, InsufficientPrivilegeError,
+                                ProtocolViolationError, UniqueViolationError)
 
 from supervisorio.infrastructure.database.connection import get_pool
 from supervisorio.core.logger import get_logger
@@ -12,9 +13,18 @@ from supervisorio.core.types.MachineEventPayload import MachineStopEventPayload
 logger = get_logger(__name__)
 T = TypeVar('T')
 
+INSERT_MODES = ('copy', 'executemany')
+
+# Servidores/proxies sem suporte a COPY (ou sem permissão): usa executemany
+COPY_UNSUPPORTED_ERRORS = (FeatureNotSupportedError, InsufficientPrivilegeError,
+                           ProtocolViolationError)
+
 
 class RepositoryBase(ABC, Generic[T]):
     _pool: Optional[Any] = None
+    insert_mode: str = 'copy'  # 'copy' (COPY binário) ou 'executemany'
+    table: str = ''
+    columns: tuple[str, ...] = ()
 
     @classmethod
     async def initialize_pool(cls):
@@ -29,6 +39,32 @@ class RepositoryBase(ABC, Generic[T]):
         """Cada repositório cria sua tabela."""
         pass
 
+    @classmethod
+    async def write(cls, conn, records: List[tuple], mode: str | None = None):
+        """
+        Grava as linhas em `cls.table`, na ordem de `cls.columns`.
+
+        No modo 'copy' o lote inteiro vai em um único COPY binário
+        (copy_records_to_table); se o servidor não aceitar COPY, o repositório
+        passa a usar executemany com um INSERT parametrizado.
+
+        :param conn: Conexão asyncpg
+        :param records: Linhas a serem gravadas
+        :param mode: Sobrepõe `cls.insert_mode`
+        """
+        if (mode or cls.insert_mode) == 'copy':
+            try:
+                await conn.copy_records_to_table(cls.table, records=records, columns=cls.columns)
+                return
+            except COPY_UNSUPPORTED_ERRORS as e:
+                logger.warning(
+                    f"COPY indisponível para {cls.table} ({e}). Usando executemany.")
+                cls.insert_mode = 'executemany'
+
+        placeholders = ', '.join(f'${i + 1}' for i in range(len(cls.columns)))
+        query = f"INSERT INTO {cls.table} ({', '.join(cls.columns)}) VALUES ({placeholders})"
+        await conn.executemany(query, records)
+
     @classmethod
     async def execute_query(cls, query: str, *args):
         """Helper para executar queries sem repetir try/except."""
@@ -46,6 +82,9 @@ class RepositoryBase(ABC, Generic[T]):
 
 
 class PesagemRepository(RepositoryBase[ModbusReadPayload]):
+    table = 'pesagens'
+    columns = ('maquina_id', 'peso', 'classificacao', 'timestamp')
+
     @classmethod
     async def initialize(cls):
         query = """
@@ -66,12 +105,11 @@ class PesagemRepository(RepositoryBase[ModbusReadPayload]):
             return
         await cls.initialize_pool()
 
-        query = "INSERT INTO pesagens (maquina_id, peso, classificacao, timestamp) VALUES ($1, $2, $3, $4)"
         values = [(i.cw_id, i.weight, i.classification, i.timestamp)
                   for i in batch]
 
         async with cls._pool.acquire() as conn:  # type:ignore
-            await conn.executemany(query, values)
+            await cls.write(conn, values)
             logger.info(f"Lote de ${len(batch)} pesagens armazenado.")
 
     @classmethod
@@ -115,6 +153,9 @@ class PesagemRepository(RepositoryBase[ModbusReadPayload]):
 
 
 class EventRepository(RepositoryBase[MachineStopEventPayload]):
+    table = 'events'
+    columns = ('maquina_id', 'evento', 'reason', 'started_at', 'ended_at', 'duration')
+
     @classmethod
     async def initialize(cls):
         query = """
@@ -137,8 +178,6 @@ class EventRepository(RepositoryBase[MachineStopEventPayload]):
             return
         await cls.initialize_pool()
 
-        query = "INSERT INTO events (maquina_id, evento, reason, started_at, ended_at, duration) VALUES ($1, $2, $3, $4, $5, $6)"
-
         values = []
         for item in batch:
             # Lógica de conversão tratada antes do envio
@@ -149,7 +188,7 @@ class EventRepository(RepositoryBase[MachineStopEventPayload]):
                           item.started_at, item.ended_at, duration))
 
         async with cls._pool.acquire() as conn:  # type:ignore
-            await conn.executemany(query, values)
+            await cls.write(conn, values)
             logger.info(f"Lote de ${len(batch)} eventos armazenado.")
 
     @classmethod
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TypeVar, Generic
 
 from pymodbus.client import AsyncModbusTcpClient
-from pymodbus.exceptions import ModbusException, ConnectionException
+from pymodbus.exceptions import ModbusException, ModbusIOException, ConnectionException
 from supervisorio.core.logger import get_logger
 from supervisorio.core.types.metrics import Metrics
 
@@ -12,28 +12,43 @@ logger = get_logger(__name__, 'collector.log')
 T = TypeVar("T")
 
 
+def _cancel_requested() -> bool:
+    task = asyncio.current_task()
+    return task is not None and task.cancelling() > 0
+
+
 class ModbusReader(ABC, Generic[T]):
     def __init__(self, name: str, ip_address: str, port: int = 502,
-                 timeout: float = 2.0, pool_interval: float = 1.0, **kwargs) -> None:
+                 timeout: float = 2.0, poll_interval: float = 1.0, **kwargs) -> None:
         self.name = name
         self.ip_address = ip_address
         self.port = port
         self.timeout = timeout
-        self.pool_interval = pool_interval
+        self.poll_interval = poll_interval
         self.metrics = Metrics()
         self.__connect_lock = asyncio.Lock()
-        self._client_modbus = AsyncModbusTcpClient(
-            ip_address, port=port, timeout=timeout)
+        # O cliente assíncrono exige um event loop ativo: é criado na primeira conexão
+        self._client_modbus: AsyncModbusTcpClient | None = None
+
+    @property
+    def connected(self) -> bool:
+        return self._client_modbus is not None and self._client_modbus.connected
 
     async def connect(self) -> bool:
         """Tenta conectar silenciosamente."""
         async with self.__connect_lock:
+            if self._client_modbus is None:
+                # retries=0: o timeout de cada leitura é aplicado pelo próprio cliente
+                self._client_modbus = AsyncModbusTcpClient(
+                    self.ip_address, port=self.port, timeout=self.timeout, retries=0)
+
             if self._client_modbus.connected:
                 self.metrics.connected = True
                 return True
 
             try:
                 # Tentativa de conexão rápida
+                self.metrics.reconnects_total += 1
                 connected = await self._client_modbus.connect()
                 if connected:
                     logger.info(f'[{self.name}] Equipamento ficou online.')
@@ -50,14 +65,16 @@ class ModbusReader(ABC, Generic[T]):
         self.metrics.reads_total += 1
         start = datetime.now()
 
-        response = await self._client_modbus.read_holding_registers(
+        response = await self._client_modbus.read_holding_registers(  # type: ignore
             first_address, count=len_address
         )
 
         self.metrics.latency = (datetime.now() - start).total_seconds()
+        self.metrics.last_latency = self.metrics.latency
 
         if response.isError():
             # Erro de protocolo (máquina ligada mas respondeu errado)
+            self.metrics.reads_error += 1
             logger.debug(f"[{self.name}] Resposta inválida: {response}")
             return []
 
@@ -74,38 +91,48 @@ class ModbusReader(ABC, Generic[T]):
             if not await self.connect():
                 return []
 
-            # Executa a leitura com timeout
-            return await asyncio.wait_for(
-                self.read(first_address, len_address),
-                timeout=self.timeout
-            )
+            return await self.read(first_address, len_address)
+
+        except ModbusIOException:
+            # O pymodbus converte o cancelamento da task em ModbusIOException
+            if _cancel_requested():
+                raise asyncio.CancelledError
 
-        except asyncio.TimeoutError:
             # Situação normal: equipamento pode ter sido desligado
             self.metrics.reads_timeout += 1
             self.metrics.connected = False
+            self.close()
             logger.debug(f"[{self.name}] Equipamento indisponível (Timeout).")
             return []
 
         except (ModbusException, ConnectionException, OSError):
+            if _cancel_requested():
+                raise asyncio.CancelledError
+
             # Perda física de conexão: limpa o estado e aguarda próxima tentativa
+            self.metrics.reads_error += 1
             self.metrics.connected = False
-            self._client_modbus.close()
+            self.close()
             return []
 
         except Exception as e:
             # Apenas erros realmente inesperados geram log de aviso
+            self.metrics.reads_error += 1
             logger.warning(
                 f"[{self.name}] Evento inesperado na comunicação: {e}")
             return []
 
+    def close(self):
+        if self._client_modbus is not None:
+            self._client_modbus.close()
+
     async def disconnect(self):
-        logger.info(f"[{self.name}] Desconectado")
-        self.connected = False
+        self.close()
         self.metrics.connected = False
+        logger.info(f"[{self.name}] Desconectado")
 
     @abstractmethod
-    def dumps(self) -> T:
+    def dumps(self, data: list[list[int]]) -> T:
         """
         Conversor de dados lidos do modbus em informação válida
         """
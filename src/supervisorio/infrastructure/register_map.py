@@ -0,0 +1,176 @@
+import struct
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Sequence
+
+MAX_READ_REGISTERS = 125  # limite do protocolo Modbus por read_holding_registers
+
+# tipo -> código do struct (big-endian dentro de cada registrador)
+FIELD_TYPES = {
+    "uint16": "H",
+    "int16": "h",
+    "uint32": "I",
+    "int32": "i",
+    "float32": "f",
+    "uint64": "Q",
+    "int64": "q",
+    "float64": "d",
+}
+
+
+@dataclass(frozen=True)
+class RegisterField:
+    name: str
+    address: int
+    type: str = "uint16"
+    word_order: str = "big"  # "little": registrador menos significativo primeiro
+
+    @property
+    def code(self) -> str:
+        return FIELD_TYPES[self.type]
+
+    @property
+    def size(self) -> int:
+        """Quantidade de registradores de 16 bits ocupados"""
+        return struct.calcsize(self.code) // 2
+
+    @property
+    def end(self) -> int:
+        return self.address + self.size
+
+
+@dataclass(frozen=True)
+class ReadBlock:
+    address: int
+    count: int
+    fields: tuple[RegisterField, ...]
+
+
+def plan_reads(fields: Iterable[RegisterField], max_gap: int = 8,
+               max_count: int = MAX_READ_REGISTERS) -> list[ReadBlock]:
+    """
+    Agrupa os campos no menor número de leituras contíguas.
+
+    Campos separados por até `max_gap` registradores não usados são lidos no
+    mesmo bloco (ler alguns registradores a mais custa menos que uma nova
+    requisição), respeitando o limite de `max_count` registradores por leitura.
+    """
+    blocks: list[ReadBlock] = []
+    current: list[RegisterField] = []
+    start = end = 0
+
+    for field in sorted(fields, key=lambda f: f.address):
+        if current and field.address < end:
+            raise ValueError(
+                f"Campos sobrepostos no mapa de registradores: {current[-1].name} e {field.name}")
+
+        if current and field.address - end <= max_gap and field.end - start <= max_count:
+            current.append(field)
+            end = field.end
+            continue
+
+        if current:
+            blocks.append(ReadBlock(start, end - start, tuple(current)))
+        current, start, end = [field], field.address, field.end
+
+    if current:
+        blocks.append(ReadBlock(start, end - start, tuple(current)))
+
+    return blocks
+
+
+class RegisterMap:
+    """
+    Mapa declarativo de registradores de um modelo de equipamento.
+
+    Na construção o mapa é compilado uma única vez: as leituras são planejadas
+    (`blocks`) e todos os campos são decodificados por um único struct sobre um
+    buffer pré-alocado. No caminho quente, `decode` executa apenas um pack_into
+    por bloco e um unpack_from, sem trabalho Python por campo.
+    """
+
+    def __init__(self, name: str, fields: Sequence[RegisterField],
+                 output: Sequence[str] | None = None, max_gap: int = 8) -> None:
+        self.name = name
+        self.fields = tuple(fields)
+        self.blocks = plan_reads(self.fields, max_gap=max_gap)
+
+        names = [f.name for f in self.fields]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Mapa '{name}': nomes de campos duplicados")
+
+        # Campos exigidos primeiro (na ordem pedida) e os demais em seguida
+        output = list(output or [])
+        missing = [n for n in output if n not in names]
+        if missing:
+            raise ValueError(f"Mapa '{name}': campos obrigatórios ausentes: {missing}")
+        self.names = tuple(output + [n for n in names if n not in output])
+
+        self.__compile()
+
+    def __compile(self):
+        fmt = ">"
+        offset = 0
+        unpacked: list[str] = []
+        self._packers: list[tuple[struct.Struct, int, Callable[[Sequence[int]], Any] | None]] = []
+
+        for block in self.blocks:
+            permutation = list(range(block.count))
+            cursor = block.address
+
+            for field in block.fields:
+                if field.address > cursor:
+                    fmt += f"{(field.address - cursor) * 2}x"
+                fmt += field.code
+                unpacked.append(field.name)
+
+                if field.word_order == "little" and field.size > 1:
+                    first = field.address - block.address
+                    permutation[first:first + field.size] = reversed(
+                        permutation[first:first + field.size])
+                cursor = field.end
+
+            getter = None
+            if permutation != list(range(block.count)):
+                getter = itemgetter(*permutation)
+
+            self._packers.append(
+                (struct.Struct(f">{block.count}H"), offset, getter))
+            offset += block.count * 2
+
+        self._buffer = bytearray(offset)
+        self._view = memoryview(self._buffer)
+        self._unpack = struct.Struct(fmt).unpack_from
+
+        order = [unpacked.index(n) for n in self.names]
+        if len(order) == 1:
+            self._order = lambda values: (values[order[0]],)
+        else:
+            self._order = itemgetter(*order)
+
+    def decode(self, blocks: Sequence[Sequence[int]]) -> tuple:
+        """
+        Decodifica os registradores lidos (um item por bloco de `self.blocks`).
+
+        :return: valores na ordem de `self.names`
+        """
+        buffer = self._buffer
+        for (packer, offset, getter), registers in zip(self._packers, blocks):
+            packer.pack_into(buffer, offset,
+                             *(getter(registers) if getter else registers))
+        return self._order(self._unpack(self._view))
+
+    @classmethod
+    def from_config(cls, name: str, config: dict, output: Sequence[str] | None = None):
+        """Cria o mapa a partir de uma seção [register_maps.<modelo>] do settings.toml"""
+        fields = []
+        for entry in config.get("fields", []):
+            if entry.get("type", "uint16") not in FIELD_TYPES:
+                raise ValueError(
+                    f"Mapa '{name}': tipo inválido '{entry.get('type')}' no campo {entry.get('name')}")
+            fields.append(RegisterField(name=entry["name"],
+                                        address=int(entry["address"]),
+                                        type=entry.get("type", "uint16"),
+                                        word_order=entry.get("word_order", "big")))
+
+        return cls(name, fields, output=output, max_gap=int(config.get("max_gap", 8)))
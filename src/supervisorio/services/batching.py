@@ -0,0 +1,79 @@
+import math
+
+
+class BatchController:
+    """
+    Ajusta o tamanho alvo dos lotes e o tempo de espera (linger) do worker.
+
+    O lote alvo é a taxa de chegada dividida por `max_round_trips`, de modo que
+    o banco receba no máximo esse número de inserts por segundo; com fila
+    acumulada o lote cresce para drená-la. O tamanho é limitado para que o
+    insert estimado (custo por linha medido) caiba em metade do `latency_slo`,
+    e o linger nunca ultrapassa o que sobra do SLO depois do insert.
+    """
+
+    def __init__(self, max_size: int = 5_000, max_linger: float = 0.5,
+                 max_round_trips: float = 10.0, latency_slo: float = 2.0,
+                 smoothing: float = 0.3) -> None:
+        """
+        :param max_size: Tamanho máximo do lote
+        :param max_linger: Espera máxima (s) por mais itens após o primeiro
+        :param max_round_trips: Inserts por segundo desejados no máximo
+        :param latency_slo: Latência ponta a ponta alvo (s): espera no lote + insert
+        :param smoothing: Peso da nova medição nas médias móveis
+        """
+        self.max_size = max_size
+        self.max_linger = max_linger
+        self.max_round_trips = max_round_trips
+        self.latency_slo = latency_slo
+        self.smoothing = smoothing
+
+        self.batch_size = min(500, max_size)
+        self.linger = max_linger
+        self.arrival_rate: float | None = None  # itens/s (média móvel)
+        self.row_cost: float | None = None      # s por linha no insert (média móvel)
+        self.insert_latency: float = 0.0        # último insert (s)
+        self._last_batch: float | None = None
+        self._last_depth = 0
+
+    def _smooth(self, current: float | None, value: float) -> float:
+        if current is None:
+            return value
+        return self.smoothing * value + (1 - self.smoothing) * current
+
+    def update(self, size: int, latency: float, queue_depth: int, now: float) -> None:
+        """
+        Registra um lote gravado e recalcula `batch_size` e `linger`.
+
+        :param size: Itens do lote
+        :param latency: Duração do insert_many (s)
+        :param queue_depth: Itens ainda no buffer após o lote
+        :param now: Instante do fim do insert (relógio monotônico)
+        """
+        self.insert_latency = latency
+        if size:
+            self.row_cost = self._smooth(self.row_cost, latency / size)
+        if self._last_batch is not None and now > self._last_batch:
+            arrived = max(0, size + queue_depth - self._last_depth)
+            self.arrival_rate = self._smooth(
+                self.arrival_rate, arrived / (now - self._last_batch))
+        self._last_batch = now
+        self._last_depth = queue_depth
+
+        # Maior lote cujo insert estimado cabe em metade do SLO
+        limit = self.max_size
+        if self.row_cost:
+            limit = min(limit, max(1, int(self.latency_slo / 2 / self.row_cost)))
+
+        target = math.ceil((self.arrival_rate or 0) / self.max_round_trips)
+        self.batch_size = max(1, min(limit, max(target, queue_depth)))
+
+        if queue_depth >= self.batch_size:
+            self.linger = 0.0  # fila acumulada: o lote enche sem esperar
+            return
+
+        # Espera só o necessário para respeitar max_round_trips, dentro do SLO
+        expected_insert = (self.row_cost or 0) * self.batch_size
+        self.linger = max(0.0, min(self.max_linger,
+                                   1 / self.max_round_trips - latency,
+                                   self.latency_slo - expected_insert))
@@ -0,0 +1,191 @@
+import asyncio
+import random
+from dataclasses import dataclass
+
+from supervisorio.core.logger import get_logger
+from supervisorio.core.types.event_types import EventTypes
+from supervisorio.infrastructure.CW import CheckWeigher, MAX_RETRY_DELAY
+
+logger = get_logger(__name__, 'collector.log')
+
+
+class AdaptiveRate:
+    """
+    Ajusta o intervalo de leitura conforme a frequência de troca do operation_id.
+
+    Enquanto o equipamento pesa, o intervalo acompanha o período medido entre
+    operações dividido por `oversample` (lê mais rápido que a máquina produz).
+    Sem operações, o intervalo cresce gradualmente até `max_interval`.
+    """
+
+    def __init__(self, interval: float, min_interval: float, max_interval: float,
+                 oversample: float = 3.0, decay: float = 1.25, smoothing: float = 0.3) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = self._clamp(interval)
+        self.oversample = oversample
+        self.decay = decay
+        self.smoothing = smoothing
+        self.change_period: float | None = None  # média móvel entre operações (s)
+        self.last_change: float | None = None
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min_interval), self.max_interval)
+
+    def update(self, advanced: int, now: float) -> float:
+        """
+        Registra o resultado de uma leitura e retorna o próximo intervalo.
+
+        :param advanced: operações avançadas desde a leitura anterior
+        :param now: instante da leitura (relógio monotônico)
+        """
+        if advanced > 1:
+            # Operações perdidas: a máquina está mais rápida que a leitura
+            self.interval = self.min_interval
+
+        if advanced:
+            if self.last_change is not None:
+                period = (now - self.last_change) / advanced
+                self.change_period = period if self.change_period is None else (
+                    self.smoothing * period + (1 - self.smoothing) * self.change_period)
+                self.interval = self._clamp(
+                    min(self.interval, self.change_period / self.oversample))
+            self.last_change = now
+            return self.interval
+
+        # Sem operação: desacelera só após o período esperado ser excedido
+        expected = self.change_period or self.interval
+        if self.last_change is None or now - self.last_change > expected * 2:
+            self.interval = self._clamp(self.interval * self.decay)
+        elif self.change_period is not None:
+            self.interval = self._clamp(self.change_period / self.oversample)
+
+        return self.interval
+
+
+@dataclass
+class DeviceSchedule:
+    device: CheckWeigher
+    rate: AdaptiveRate
+    tick: float = 0
+    retry_delay: float = 0
+    handle: asyncio.TimerHandle | None = None
+    task: asyncio.Task | None = None
+
+
+class PollScheduler:
+    """
+    Agendador central de leituras baseado em deadlines.
+
+    As leituras são disparadas pelo timer do event loop em ticks fixos
+    (tick seguinte = tick anterior + intervalo), sem acumular a latência da
+    leitura. Cada equipamento recebe uma fase aleatória dentro do intervalo,
+    espalhando as leituras, e cada tick sofre um jitter de até `jitter` do
+    intervalo. Ticks que passam enquanto a leitura anterior ainda está em
+    andamento são contabilizados em `metrics.deadlines_missed`.
+    """
+
+    def __init__(self, devices: list[CheckWeigher], jitter: float = 0.05,
+                 seed: int | None = None) -> None:
+        self.devices = devices
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.schedules: list[DeviceSchedule] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopping = False
+
+    def _arm(self, schedule: DeviceSchedule, tick: float, interval: float):
+        schedule.tick = tick
+        fire_at = tick + self.random.uniform(0, self.jitter * interval)
+        schedule.handle = self._loop.call_at(  # type: ignore
+            fire_at, self._fire, schedule)
+
+    def _fire(self, schedule: DeviceSchedule):
+        schedule.handle = None
+        schedule.task = self._loop.create_task(  # type: ignore
+            self._poll(schedule), name=f"{schedule.device.name} poll")
+
+    async def _poll(self, schedule: DeviceSchedule):
+        device = schedule.device
+        advanced = None
+
+        try:
+            advanced = await device.poll()
+        except Exception as e:
+            device.metrics.reads_error += 1
+            device.logger.warning(f'[{device.name}] {e}')
+            try:
+                await device.dispatch(EventTypes.ERROR, e)
+            except Exception as handler_error:
+                device.logger.error(
+                    f'[{device.name}] Falha no tratamento do erro: {handler_error}')
+        finally:
+            # Reagenda sempre: uma falha na leitura ou no handler não pode
+            # deixar o equipamento sem leituras
+            if not self._stopping:
+                self._reschedule(schedule, advanced)
+
+    def _reschedule(self, schedule: DeviceSchedule, advanced: int | None):
+        device = schedule.device
+        now = self._loop.time()  # type: ignore
+
+        if advanced is None:
+            # Equipamento indisponível: backoff exponencial fora da grade de ticks
+            schedule.retry_delay = min(
+                max(schedule.retry_delay * 2, 1), MAX_RETRY_DELAY)
+            self._arm(schedule, now + schedule.retry_delay, schedule.rate.interval)
+            return
+
+        if schedule.retry_delay:
+            # Voltou a responder: reinicia a grade a partir de agora
+            schedule.retry_delay = 0
+            schedule.tick = now
+
+        interval = schedule.rate.update(advanced, now)
+        device.metrics.poll_interval = interval
+
+        # Próximo deadline ancorado no tick anterior: sem deriva
+        tick = schedule.tick + interval
+        if tick < now:
+            missed = int((now - tick) // interval) + 1
+            device.metrics.deadlines_missed += missed
+            tick += missed * interval
+
+        self._arm(schedule, tick, interval)
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._stopping = False
+        now = self._loop.time()
+
+        for device in self.devices:
+            rate = AdaptiveRate(device.poll_interval,
+                                device.min_poll_interval, device.max_poll_interval)
+            schedule = DeviceSchedule(device=device, rate=rate)
+            self.schedules.append(schedule)
+            device.metrics.poll_interval = rate.interval
+            # Fase aleatória: distribui os equipamentos ao longo do intervalo
+            self._arm(schedule, now + self.random.uniform(0, rate.interval), rate.interval)
+
+        logger.info(f"Agendador de leituras iniciado para {len(self.devices)} CWs")
+
+    async def stop(self):
+        self._stopping = True
+        tasks = []
+        for schedule in self.schedules:
+            if schedule.handle is not None:
+                schedule.handle.cancel()
+            if schedule.task is not None and not schedule.task.done():
+                schedule.task.cancel()
+                tasks.append(schedule.task)
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.schedules.clear()
+
+    async def run(self):
+        """Executa o agendamento até a task ser cancelada"""
+        self.start()
+        try:
+            await asyncio.Future()
+        finally:
+            await self.stop()
@@ -0,0 +1,102 @@
+import time
+import multiprocessing
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from supervisorio.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SupervisedProcess:
+    name: str
+    target: Callable[..., Any]
+    args: tuple = ()
+    process: multiprocessing.Process | None = None
+    restarts: int = 0
+    restart_delay: float = 0
+    restart_at: float = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+
+class ProcessSupervisor:
+    """
+    Mantém um conjunto de processos filhos vivos.
+    Processos que encerram com erro (exitcode != 0) são reiniciados com
+    backoff exponencial; encerramentos limpos (exitcode 0) não são reiniciados.
+    """
+
+    def __init__(self, restart_delay: float = 1.0, max_restart_delay: float = 60.0,
+                 stable_after: float = 60.0) -> None:
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        # Processo que roda por mais que `stable_after` segundos zera o backoff
+        self.stable_after = stable_after
+        self.children: list[SupervisedProcess] = []
+        self.running = False
+
+    def add(self, name: str, target: Callable[..., Any], args: tuple = ()) -> SupervisedProcess:
+        child = SupervisedProcess(name=name, target=target, args=args)
+        self.children.append(child)
+        return child
+
+    def _spawn(self, child: SupervisedProcess):
+        child.process = multiprocessing.Process(
+            target=child.target, args=child.args, name=child.name)
+        child.process.start()
+        child.started_at = time.monotonic()
+        logger.info(f"Processo {child.name} iniciado [PID {child.process.pid}]")
+
+    def start(self):
+        self.running = True
+        for child in self.children:
+            self._spawn(child)
+
+    def check(self):
+        """Executa uma passada de supervisão, reiniciando processos que falharam"""
+        now = time.monotonic()
+
+        for child in self.children:
+            process = child.process
+            if process is None or process.is_alive():
+                continue
+
+            if process.exitcode == 0:
+                continue  # Encerramento limpo: não reinicia
+
+            if child.restart_at == 0:
+                # Falha detectada agora: agenda o restart com backoff
+                if now - child.started_at > self.stable_after:
+                    child.restart_delay = 0
+                child.restart_delay = min(
+                    max(child.restart_delay * 2, self.restart_delay), self.max_restart_delay)
+                child.restart_at = now + child.restart_delay
+                logger.error(
+                    f"Processo {child.name} encerrou com código {process.exitcode}, "
+                    f"reiniciando em {child.restart_delay:.0f}s")
+
+            if now >= child.restart_at:
+                child.restarts += 1
+                child.restart_at = 0
+                self._spawn(child)
+
+    def alive(self) -> bool:
+        return any(child.process is not None and (child.process.is_alive() or child.restart_at)
+                   for child in self.children)
+
+    def watch(self, interval: float = 1.0):
+        """Bloqueia supervisionando os processos até que todos encerrem"""
+        while self.running and self.alive():
+            self.check()
+            time.sleep(interval)
+
+    def stop(self, timeout: float = 10.0):
+        self.running = False
+        for child in self.children:
+            if child.process is not None and child.process.is_alive():
+                child.process.terminate()
+
+        for child in self.children:
+            if child.process is not None:
+                child.process.join(timeout)
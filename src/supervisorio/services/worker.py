@@ -1,61 +1,210 @@
 import asyncio
+from asyncpg.exceptions import CannotConnectNowError, InterfaceError, PostgresConnectionError
 from supervisorio.core.buffer import Buffer
 from supervisorio.infrastructure.database.repositories import PesagemRepository
 from supervisorio.core.logger import get_logger
 from supervisorio.infrastructure.database.repositories import RepositoryBase
 from supervisorio.core.monitor import monitor
+from supervisorio.services.batching import BatchController
 
 logger = get_logger(__name__)
 
+# Falhas de disponibilidade do banco: o lote é mantido e reenviado
+UNAVAILABLE_ERRORS = (OSError, TimeoutError, PostgresConnectionError,
+                      CannotConnectNowError, InterfaceError)
 
-async def worker(buffer: Buffer, repository: type[RepositoryBase], worker_name: str = 'Genérico'):
+
+class WriterPool:
     """
-    Monitora ciclicamente o buffer, e quando tem dados, envia ao repository pelo metodo insert_many
+    Grava os lotes de um Buffer com até `writers` inserts simultâneos, cada um
+    em uma conexão do pool do asyncpg.
 
-    :param buffer: Fila de dados a serem inseridos
-    :type buffer: Buffer
-    :param repository: Repositório que gerencia o banco de dados
-    :type repository:  type[RepositoryBase]
-    :param worker_name: Nome que será exibido em logs
-    :type worker_name: str
+    Os lotes são retirados do buffer um por vez (sob lock), recebendo um número
+    de sequência; as confirmações ao buffer (ack) seguem essa sequência, mesmo
+    que os inserts terminem fora de ordem. No cancelamento, os writers são
+    interrompidos e o flush final grava em paralelo os lotes em andamento e o
+    restante da fila.
     """
 
-    logger.info(f"Worker {worker_name} iniciado")
+    def __init__(self, buffer: Buffer, repository: type[RepositoryBase], name: str = 'Genérico',
+                 writers: int = 1, batch_size: int = 500,
+                 controller: BatchController | None = None) -> None:
+        self.buffer = buffer
+        self.repository = repository
+        self.name = name
+        self.writers = max(1, writers)
+        self.batch_size = batch_size
+        self.controller = controller or BatchController(max_size=batch_size)
+        self.component = f"worker_{name.lower()}"
 
-    while True:
-        try:
-            monitor.update_heartbeat(
-                f"worker_{worker_name.lower()}", buffer_size=buffer.qsize())
-            batch = await buffer.get_batch(batch_size=500)
-            if buffer.qsize() > 8_000:
+        self.in_flight = 0  # lotes com insert em andamento
+        self._held: dict[int, list] = {}  # lotes retirados do buffer e não concluídos
+        self._done: set[int] = set()      # concluídos aguardando a confirmação de anteriores
+        self._next_seq = 0
+        self._next_ack = 0
+        self._lock = asyncio.Lock()
+        self._closing = False
+
+    @property
+    def pending_acks(self) -> int:
+        return len(self._done)
+
+    def _heartbeat(self, processed: int = 0):
+        monitor.update_heartbeat(
+            self.component, buffer_size=self.buffer.qsize(), increment_processed=processed,
+            batch_size=self.controller.batch_size, linger=self.controller.linger,
+            insert_latency=self.controller.insert_latency,
+            in_flight=self.in_flight, pending_acks=self.pending_acks)
+
+    def _hold(self, batch: list) -> int:
+        seq = self._next_seq
+        self._next_seq += 1
+        self._held[seq] = batch
+        return seq
+
+    async def _take(self) -> tuple[int, list]:
+        async with self._lock:
+            self._heartbeat()
+            batch = await self.buffer.get_batch(batch_size=self.controller.batch_size,
+                                                linger=self.controller.linger)
+            if self.buffer.qsize() > 8_000:
                 logger.critical(
-                    f'Worker {worker_name}: buffer excedeu 80% da capacidade')
+                    f'Worker {self.name}: buffer excedeu 80% da capacidade')
+            return self._hold(batch), batch
+
+    def _settle(self, seq: int, saved: bool = True):
+        """Conclui o lote `seq` e confirma ao buffer, em ordem, os lotes concluídos"""
+        batch = self._held.pop(seq)
+        if not saved:
+            # Só ocorre no flush, com todos os lotes anteriores já resolvidos
+            if self.buffer.reject(batch):
+                logger.info(f"Flush: {len(batch)} itens mantidos no spool em disco.")
+            self._next_ack += 1
+        else:
+            self._done.add(seq)
+
+        while self._next_ack in self._done:
+            self._done.remove(self._next_ack)
+            self.buffer.ack()
+            self._next_ack += 1
+
+    async def _write(self, batch: list):
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        started = loop.time()
+        try:
+            await asyncio.wait_for(self.repository.insert_many(batch), timeout=10)
+        finally:
+            self.in_flight -= 1
+
+        self.controller.update(len(batch), loop.time() - started,
+                               self.buffer.qsize(), loop.time())
+        self._heartbeat(len(batch))
+        logger.debug(
+            f"Lote de {len(batch)} itens armazendos pelo worker {self.name}.")
+
+    async def _writer(self):
+        while not self._closing:
+            seq, batch = await self._take()
+
+            while True:
+                try:
+                    await self._write(batch)
+                    break
+                except UNAVAILABLE_ERRORS as e:
+                    logger.error(f"Banco indisponível para o worker {self.name}: {e}")
+                    monitor.report_error(self.component)
+                    if not self.buffer.durable:
+                        break  # sem spool o lote é descartado
+                    await asyncio.sleep(1)
+                except Exception as e:
+                    logger.error(f"Erro crítico no worker {self.name}: {e}")
+                    monitor.report_error(self.component)
+                    await asyncio.sleep(1)
+                    break
 
-            if not batch:
-                continue
+            self._settle(seq)
 
-            await asyncio.wait_for(repository.insert_many(batch), timeout=10)
+    async def _flush_batches(self, batches: list[tuple[int, list]]) -> bool:
+        """Grava os lotes em paralelo; retorna False se algum falhou"""
+        semaphore = asyncio.Semaphore(self.writers)
 
-            monitor.update_heartbeat(
-                f"worker_{worker_name.lower()}", increment_processed=len(batch))
-            logger.debug(
-                f"Lote de {len(batch)} itens armazendos pelo worker {worker_name}.")
+        async def save(batch: list) -> bool:
+            async with semaphore:
+                try:
+                    await asyncio.wait_for(self.repository.insert_many(batch), timeout=5)
+                    logger.info(f"Flush: {len(batch)} itens salvos antes do desligamento.")
+                    return True
+                except Exception as e:
+                    logger.error(f"Erro no flush final do worker {self.name}: {e}")
+                    return False
+
+        results = await asyncio.gather(*(save(batch) for _, batch in batches))
+        for (seq, _), saved in zip(batches, results):
+            self._settle(seq, saved)
+        return all(results)
+
+    async def flush(self):
+        """Flush final: lotes em andamento e, em seguida, o restante da fila"""
+        # Flush final Garante que dados remanescentes não sejam perdidos
+        saved = await self._flush_batches(
+            [(seq, self._held[seq]) for seq in sorted(self._held)])
+
+        if not saved and self.buffer.durable:
+            # Banco fora: o restante da fila é gravado no spool pelo buffer.close()
+            return
+
+        remaining = []
+        while self.buffer.qsize() > 0:
+            batch = await self.buffer.get_batch(batch_size=self.batch_size)
+            remaining.append((self._hold(batch), batch))
+        await self._flush_batches(remaining)
+
+    async def run(self):
+        logger.info(f"Worker {self.name} iniciado com {self.writers} writer(s)")
+        tasks = [asyncio.create_task(self._writer(), name=f"{self.name}-writer-{i + 1}")
+                 for i in range(self.writers)]
+        try:
+            await asyncio.gather(*tasks)
         except asyncio.CancelledError:
-            logger.info(f'Worker {worker_name} sendo cancelado')
-
-            # Flush final Garante que dados remanescentes não sejam perdidos
-            while buffer.qsize() > 0:
-                final_batch = await buffer.get_batch(batch_size=500)
-                if final_batch:
-                    try:
-                        await asyncio.wait_for(repository.insert_many(final_batch), timeout=5)
-                        logger.info(
-                            f"Flush: {len(final_batch)} itens salvos antes do desligamento.")
-                    except Exception as e:
-                        logger.error(
-                            f"Erro no flush final do worker {worker_name}: {e}")
-            break
-        except Exception as e:
-            logger.error(f"Erro crítico no worker {worker_name}: {e}")
-            monitor.report_error(f"worker_{worker_name.lower()}")
-            await asyncio.sleep(1)
+            logger.info(f'Worker {self.name} sendo cancelado')
+            self._closing = True
+            # No Python 3.11 o wait_for pode engolir o cancelamento se o insert
+            # terminar no mesmo ciclo; o writer então para no fim do lote atual
+            pending = set(tasks)
+            while pending:
+                for task in pending:
+                    task.cancel()
+                _, pending = await asyncio.wait(pending, timeout=0.1)
+            await self.flush()
+
+
+async def worker(buffer: Buffer, repository: type[RepositoryBase], worker_name: str = 'Genérico',
+                 batch_size: int = 500, controller: BatchController | None = None,
+                 writers: int = 1):
+    """
+    Monitora ciclicamente o buffer, e quando tem dados, envia ao repository pelo metodo insert_many
+
+    Com spool em disco no buffer, um lote que falhou por indisponibilidade do
+    banco é mantido e reenviado até ser persistido; enquanto isso o buffer
+    desvia as novas leituras para o disco.
+
+    O tamanho dos lotes e o tempo de espera por mais itens (linger) são
+    ajustados pelo BatchController a partir da latência dos inserts e da fila.
+
+    :param buffer: Fila de dados a serem inseridos
+    :type buffer: Buffer
+    :param repository: Repositório que gerencia o banco de dados
+    :type repository:  type[RepositoryBase]
+    :param worker_name: Nome que será exibido em logs
+    :type worker_name: str
+    :param batch_size: Máximo de itens por lote enviado ao repository
+    :type batch_size: int
+    :param controller: Controlador de lotes (padrão: BatchController(max_size=batch_size))
+    :type controller: BatchController | None
+    :param writers: Inserts simultâneos (conexões do pool) drenando o mesmo buffer
+    :type writers: int
+    """
+    pool = WriterPool(buffer, repository, worker_name, writers=writers,
+                      batch_size=batch_size, controller=controller)
+    await pool.run()
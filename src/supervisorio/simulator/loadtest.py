@@ -0,0 +1,206 @@
+"""
+Teste de carga ponta a ponta do pipeline de coleta:
+
+    simulador -> CheckWeigher.listener -> Buffer -> worker -> insert_many
+
+O simulador roda em um processo separado. Como a sequência de pesagens de cada
+CW simulado é determinística (ver DeviceProfile), o relatório compara o que foi
+gerado com o que chegou ao repositório: vazão de ingestão, latência ponta a
+ponta (geração da pesagem -> fim do insert_many) e operation_ids perdidos.
+
+Por padrão as pesagens são gravadas em um repositório em memória, isolando o
+coletor do banco. Com --database o PesagemRepository real (PostgreSQL) é usado.
+
+Uso:
+    poetry run python -m supervisorio.simulator.loadtest --devices 50 --rate 2 --duration 60
+"""
+import argparse
+import asyncio
+import multiprocessing
+import time
+from collections import Counter
+from typing import List
+
+from supervisorio.core.buffer import Buffer
+from supervisorio.core.logger import get_logger
+from supervisorio.core.types.ModbusReadPayload import ModbusReadPayload
+from supervisorio.infrastructure.CW import CheckWeigher
+from supervisorio.infrastructure.database.repositories import PesagemRepository, RepositoryBase
+from supervisorio.services.worker import worker
+from supervisorio.services.scheduler import PollScheduler
+from supervisorio.simulator.server import (DEFAULT_BASE_PORT, DEFAULT_HOST, DeviceProfile,
+                                           add_profile_arguments, build_devices,
+                                           profile_from_arguments, serve)
+
+logger = get_logger(__name__)
+
+
+class IngestLog:
+    """Registro das pesagens persistidas: (cw_id, operation_id) -> instante do insert"""
+    received: dict[tuple[str, int], float] = {}
+    duplicates = 0
+
+    @classmethod
+    def record(cls, batch: List[ModbusReadPayload]):
+        now = time.time()
+        for item in batch:
+            key = (item.cw_id, item.operation_id)
+            if key in cls.received:
+                cls.duplicates += 1
+            else:
+                cls.received[key] = now
+
+
+class MemoryRepository:
+    """Repositório em memória: mede o coletor sem depender do PostgreSQL"""
+
+    @classmethod
+    async def insert_many(cls, batch: List[ModbusReadPayload]):
+        IngestLog.record(batch)
+
+
+class RecordingPesagemRepository(PesagemRepository):
+    """PesagemRepository real que registra o instante de cada lote persistido"""
+
+    @classmethod
+    async def insert_many(cls, batch: List[ModbusReadPayload]):
+        await super().insert_many(batch)
+        IngestLog.record(batch)
+
+
+def run_simulator(count: int, profile: DeviceProfile, started_at: float, base_port: int, seed: int):
+    devices = build_devices(count, profile, started_at, seed)
+    try:
+        asyncio.run(serve(devices, DEFAULT_HOST, base_port))
+    except KeyboardInterrupt:
+        pass
+
+
+def percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def run_pipeline(args: argparse.Namespace, started_at: float):
+    repository = RecordingPesagemRepository if args.database else MemoryRepository
+    if args.database:
+        RepositoryBase.insert_mode = args.insert_mode
+        await PesagemRepository.initialize()
+
+    buffer = Buffer[ModbusReadPayload](maxsize=10_000)
+    cws = [CheckWeigher(name=f"LOAD{i + 1}", ip_address=DEFAULT_HOST,
+                        port=args.base_port + i, cw_id=str(i + 1),
+                        poll_interval=args.poll_interval, timeout=args.timeout,
+                        logger=logger)
+           .on(CheckWeigher.eventTypes.WEIGHT_READ, buffer.put)
+           for i in range(args.devices)]
+
+    worker_task = asyncio.create_task(
+        worker(buffer=buffer, repository=repository, worker_name="loadtest",  # type: ignore
+               batch_size=args.batch_size))
+
+    await asyncio.sleep(max(0.0, started_at - time.time()))
+    if args.mode == "scheduler":
+        listeners = [asyncio.create_task(PollScheduler(cws).run())]
+    else:
+        listeners = [asyncio.create_task(cw.listener()) for cw in cws]
+    await asyncio.sleep(args.duration)
+    stopped_at = time.time()
+
+    for task in listeners:
+        task.cancel()
+    await asyncio.gather(*listeners, return_exceptions=True)
+
+    # O cancelamento do worker dispara o flush do que restou no buffer
+    worker_task.cancel()
+    await asyncio.gather(worker_task, return_exceptions=True)
+
+    for cw in cws:
+        cw.close()
+
+    return cws, stopped_at
+
+
+def report(args: argparse.Namespace, profile: DeviceProfile, cws: list[CheckWeigher],
+           started_at: float, stopped_at: float):
+    # Pesagens geradas perto do fim podem não ter sido lidas ainda: fora da conta
+    horizon = stopped_at - started_at - max(args.poll_interval, args.timeout)
+    expected = profile.weighings_until(horizon)
+
+    latencies = []
+    missed = 0
+    for cw in cws:
+        for operation_id, generated in expected:
+            received_at = IngestLog.received.get((cw.cw_id, operation_id & 0xFFFF))
+            if received_at is None:
+                missed += 1
+            else:
+                latencies.append(received_at - (started_at + generated))
+
+    total_expected = len(expected) * len(cws)
+    ingested = len(IngestLog.received)
+    elapsed = stopped_at - started_at
+    reads = Counter()
+    for cw in cws:
+        reads["leituras"] += cw.metrics.reads_success
+        reads["timeouts"] += cw.metrics.reads_timeout
+        reads["erros"] += cw.metrics.reads_error
+        reads["reconexões"] += cw.metrics.reconnects_total
+        reads["deadlines perdidos"] += cw.metrics.deadlines_missed
+        reads["saltos de operation_id"] += cw.metrics.operations_missed
+
+    print(f"CWs simulados:           {len(cws)} a {profile.rate} pesagens/s")
+    print(f"Duração:                 {elapsed:.1f}s")
+    print(f"Leituras Modbus:         {dict(reads)}")
+    print(f"Pesagens ingeridas:      {ingested} "
+          f"({ingested / elapsed:.1f}/s, {ingested / elapsed * 60:.0f}/min)")
+    print(f"Pesagens esperadas:      {total_expected}")
+    print(f"operation_ids perdidos:  {missed} ({missed / max(total_expected, 1):.2%})")
+    print(f"Duplicadas:              {IngestLog.duplicates}")
+    print("Latência ponta a ponta:  "
+          f"p50={percentile(latencies, 0.50) * 1000:.0f}ms "
+          f"p95={percentile(latencies, 0.95) * 1000:.0f}ms "
+          f"p99={percentile(latencies, 0.99) * 1000:.0f}ms "
+          f"max={max(latencies, default=0) * 1000:.0f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--poll-interval", type=float, default=0.1)
+    parser.add_argument("--timeout", type=float, default=1.0)
+    parser.add_argument("--base-port", type=int, default=DEFAULT_BASE_PORT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=["scheduler", "listener"], default="scheduler",
+                        help="PollScheduler central ou um listener (loop) por CW")
+    parser.add_argument("--database", action="store_true",
+                        help="Grava no PostgreSQL (PesagemRepository) em vez da memória")
+    parser.add_argument("--insert-mode", choices=["copy", "executemany"], default="copy")
+    parser.add_argument("--batch-size", type=int, default=500)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    profile = profile_from_arguments(args)
+    # Instante comum de início: o simulador e o relatório usam a mesma referência
+    started_at = time.time() + 2
+
+    simulator = multiprocessing.Process(
+        target=run_simulator,
+        args=(args.devices, profile, started_at, args.base_port, args.seed),
+        daemon=True)
+    simulator.start()
+
+    try:
+        cws, stopped_at = asyncio.run(run_pipeline(args, started_at))
+        report(args, profile, cws, started_at, stopped_at)
+    finally:
+        simulator.terminate()
+        simulator.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+Simulador de CheckWeighers sobre o servidor Modbus TCP do pymodbus.
+
+Cada equipamento simulado escuta em uma porta própria (assim como cada CW real
+possui um IP próprio) e expõe o mesmo bloco de registradores lido pelo coletor
+a partir de GAP_ADDRESS.
+
+O estado dos registradores é função do tempo decorrido desde `started_at`
+(ritmo de pesagem e ciclos RUN/STOP do DeviceProfile). Isso torna a sequência
+de operation_ids determinística, permitindo que o teste de carga saiba
+exatamente quais pesagens deveriam ter sido coletadas e quando ocorreram.
+
+Uso:
+    poetry run python -m supervisorio.simulator.server --devices 10 --rate 5 --run-time 60 --stop-time 10
+"""
+import argparse
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass
+
+from pymodbus.constants import ExcCodes
+from pymodbus.datastore import ModbusServerContext
+from pymodbus.datastore.context import ModbusBaseDeviceContext
+from pymodbus.server import ModbusTcpServer
+
+from supervisorio.core.logger import get_logger
+from supervisorio.infrastructure.CW import GAP_ADDRESS, SIZE_READ
+
+logger = get_logger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_BASE_PORT = 15020
+HANG_TIME = 3600  # "timeout": a resposta nunca chega dentro do prazo do cliente
+
+
+@dataclass
+class DeviceProfile:
+    """Comportamento de um CW simulado. rate=0 desliga a simulação automática."""
+    rate: float = 0.0              # pesagens/s enquanto em RUN
+    run_time: float = 0.0          # duração do RUN em segundos (0 = sempre em RUN)
+    stop_time: float = 0.0         # duração de cada parada em segundos
+    slow_rate: float = 0.0         # fração das leituras respondidas com atraso
+    slow_delay: float = 0.5        # atraso das respostas lentas (s)
+    timeout_rate: float = 0.0      # fração das leituras que nunca são respondidas
+    disconnect_every: float = 0.0  # intervalo entre quedas de conexão (0 = nunca)
+    disconnect_time: float = 2.0   # duração de cada queda (s)
+
+    @property
+    def cycling(self) -> bool:
+        return self.run_time > 0 and self.stop_time > 0
+
+    @property
+    def weighings_per_run(self) -> int:
+        # Pesagens que ocorrem estritamente antes do fim do RUN
+        return max(1, math.ceil(self.run_time * self.rate) - 1)
+
+    def state_at(self, elapsed: float) -> tuple[int, int, int]:
+        """
+        Estado do equipamento após `elapsed` segundos.
+
+        :return: (operation_id, operation_type, ciclo)
+        """
+        if self.rate <= 0 or elapsed < 0:
+            return 0, 0, 0
+
+        if not self.cycling:
+            count = math.floor(elapsed * self.rate)
+            return count, 1 if count else 0, 0
+
+        # Cada ciclo gera `weighings_per_run` pesagens + 1 operação de parada
+        per_cycle = self.weighings_per_run + 1
+        cycle, position = divmod(elapsed, self.run_time + self.stop_time)
+        cycle = int(cycle)
+
+        if position >= self.run_time:
+            return cycle * per_cycle + per_cycle, 0, cycle
+
+        count = min(math.floor(position * self.rate), self.weighings_per_run)
+        if count == 0:
+            # Nenhuma pesagem no RUN atual: mantém o estado de parada anterior
+            return cycle * per_cycle, 0, cycle - 1
+        return cycle * per_cycle + count, 1, cycle
+
+    def weighings_until(self, elapsed: float) -> list[tuple[int, float]]:
+        """
+        Pesagens geradas até `elapsed` segundos.
+
+        :return: lista de (operation_id, segundos desde o início)
+        """
+        if self.rate <= 0:
+            return []
+
+        if not self.cycling:
+            return [(n, n / self.rate)
+                    for n in range(1, math.floor(elapsed * self.rate) + 1)]
+
+        result = []
+        per_cycle = self.weighings_per_run + 1
+        period = self.run_time + self.stop_time
+        for cycle in range(int(elapsed // period) + 1):
+            for k in range(1, self.weighings_per_run + 1):
+                generated = cycle * period + k / self.rate
+                if generated > elapsed:
+                    return result
+                result.append((cycle * per_cycle + k, generated))
+        return result
+
+
+def weight_for(operation_id: int) -> int:
+    return 500 + (operation_id * 37) % 50
+
+
+def classification_for(operation_id: int) -> int:
+    return operation_id % 3
+
+
+class SimulatedCheckWeigher(ModbusBaseDeviceContext):
+    """Datastore de um CW simulado: apenas o bloco de holding registers do coletor"""
+
+    def __init__(self, cw_id: int, profile: DeviceProfile | None = None,
+                 started_at: float | None = None, seed: int | None = None):
+        self.cw_id = cw_id
+        self.profile = profile or DeviceProfile()
+        self.started_at = time.time() if started_at is None else started_at
+        self.random = random.Random(seed)
+        self.registers = [0] * SIZE_READ
+        if self.profile.rate <= 0:
+            self.registers[0] = 1  # operation_type: RUN (modo manual)
+
+    def reset(self):
+        self.registers = [0] * SIZE_READ
+
+    def weigh(self, weight: int, classification: int = 0):
+        """Registra uma nova pesagem, avançando o operation_id (modo manual)"""
+        self.registers[1] = weight
+        self.registers[2] = classification
+        self.registers[10] = (self.registers[10] + 1) & 0xFFFF
+
+    def refresh(self, now: float | None = None):
+        """Atualiza os registradores conforme o perfil e o tempo decorrido"""
+        if self.profile.rate <= 0:
+            return
+
+        elapsed = (time.time() if now is None else now) - self.started_at
+        operation_id, operation_type, cycle = self.profile.state_at(elapsed)
+
+        self.registers[0] = operation_type
+        self.registers[1] = weight_for(operation_id) if operation_type else 0
+        self.registers[2] = classification_for(operation_id)
+        self.registers[3] = round(self.profile.rate * 60) if operation_type else 0
+        self.registers[7] = 0 if operation_type else (max(cycle, 0) % 20) + 1  # motivo da parada
+        self.registers[10] = operation_id & 0xFFFF
+
+    def getValues(self, func_code, address, count=1):
+        offset = address - GAP_ADDRESS
+        if self.decode(func_code) != "h" or offset < 0 or offset + count > SIZE_READ:
+            return ExcCodes.ILLEGAL_ADDRESS
+        self.refresh()
+        return self.registers[offset:offset + count]
+
+    def setValues(self, func_code, address, values):
+        offset = address - GAP_ADDRESS
+        if self.decode(func_code) != "h" or offset < 0 or offset + len(values) > SIZE_READ:
+            return ExcCodes.ILLEGAL_ADDRESS
+        self.registers[offset:offset + len(values)] = values
+        return None
+
+    async def async_getValues(self, func_code, address, count=1):
+        # Injeção de falhas: sem resposta ou resposta lenta
+        draw = self.random.random()
+        if draw < self.profile.timeout_rate:
+            await asyncio.sleep(HANG_TIME)
+        elif draw < self.profile.timeout_rate + self.profile.slow_rate:
+            await asyncio.sleep(self.profile.slow_delay)
+        return self.getValues(func_code, address, count)
+
+    async def serve(self, host: str, port: int):
+        """Atende o equipamento, derrubando a conexão periodicamente se configurado"""
+        profile = self.profile
+
+        while True:
+            server = build_server(self, host, port)
+            task = asyncio.create_task(server.serve_forever())
+            try:
+                if not profile.disconnect_every:
+                    await task
+                    return
+
+                await asyncio.sleep(profile.disconnect_every)
+                logger.debug(f"Simulador: CW {self.cw_id} desconectado")
+                await server.shutdown()
+                await task
+                await asyncio.sleep(profile.disconnect_time)
+            finally:
+                await server.shutdown()
+
+
+def build_server(device: SimulatedCheckWeigher, host: str, port: int) -> ModbusTcpServer:
+    context = ModbusServerContext(devices=device, single=True)
+    return ModbusTcpServer(context, address=(host, port))
+
+
+async def serve(devices: list[SimulatedCheckWeigher],
+                host: str = DEFAULT_HOST, base_port: int = DEFAULT_BASE_PORT):
+    """Sobe um servidor por equipamento, nas portas base_port + índice"""
+    logger.info(
+        f"Simulador: {len(devices)} CWs em {host}:{base_port}-{base_port + len(devices) - 1}")
+
+    await asyncio.gather(*(device.serve(host, base_port + i)
+                           for i, device in enumerate(devices)))
+
+
+def build_devices(count: int, profile: DeviceProfile,
+                  started_at: float | None = None, seed: int | None = None):
+    started_at = time.time() if started_at is None else started_at
+    return [SimulatedCheckWeigher(i + 1, profile, started_at,
+                                  seed=None if seed is None else seed + i)
+            for i in range(count)]
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--rate", type=float, default=2.0,
+                        help="Pesagens/s de cada CW em RUN")
+    parser.add_argument("--run-time", type=float, default=0.0,
+                        help="Duração do RUN em segundos (0 = sempre em RUN)")
+    parser.add_argument("--stop-time", type=float, default=0.0,
+                        help="Duração de cada parada em segundos")
+    parser.add_argument("--slow-rate", type=float, default=0.0,
+                        help="Fração das leituras respondidas com atraso")
+    parser.add_argument("--slow-delay", type=float, default=0.5)
+    parser.add_argument("--timeout-rate", type=float, default=0.0,
+                        help="Fração das leituras que nunca são respondidas")
+    parser.add_argument("--disconnect-every", type=float, default=0.0,
+                        help="Intervalo entre quedas de conexão (s)")
+    parser.add_argument("--disconnect-time", type=float, default=2.0)
+
+
+def profile_from_arguments(args: argparse.Namespace) -> DeviceProfile:
+    return DeviceProfile(rate=args.rate, run_time=args.run_time, stop_time=args.stop_time,
+                         slow_rate=args.slow_rate, slow_delay=args.slow_delay,
+                         timeout_rate=args.timeout_rate,
+                         disconnect_every=args.disconnect_every,
+                         disconnect_time=args.disconnect_time)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulador de CheckWeighers Modbus")
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--base-port", type=int, default=DEFAULT_BASE_PORT)
+    parser.add_argument("--seed", type=int, default=None)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    devices = build_devices(args.devices, profile_from_arguments(args), seed=args.seed)
+    try:
+        asyncio.run(serve(devices, args.host, args.base_port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
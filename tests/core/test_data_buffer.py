@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from supervisorio.core.buffer import Buffer
@@ -37,3 +39,48 @@ async def test_get_batch_when_batch_size_exceeds_buffer_size():
     result = await buffer.get_batch(10)
 
     assert result == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_get_batch_lingers_for_more_items():
+    buffer = Buffer()
+    await buffer.put(1)
+
+    async def produce():
+        await asyncio.sleep(0.02)
+        await buffer.put(2)
+        await buffer.put(3)
+
+    producer = asyncio.create_task(produce())
+    result = await buffer.get_batch(3, linger=1.0)
+    await producer
+
+    assert result == [1, 2, 3], 'Should return as soon as the batch is full'
+
+
+@pytest.mark.asyncio
+async def test_get_batch_returns_partial_batch_after_linger():
+    buffer = Buffer()
+    await buffer.put(1)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await buffer.get_batch(10, linger=0.05)
+
+    assert result == [1]
+    assert loop.time() - started >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_get_batch_cancelled_while_lingering_keeps_items():
+    buffer = Buffer()
+    await buffer.put(1)
+
+    task = asyncio.create_task(buffer.get_batch(10, linger=10))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await buffer.put(2)
+
+    assert buffer.qsize() == 2
+    assert await buffer.get_batch(10) == [1, 2]
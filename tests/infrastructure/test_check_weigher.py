@@ -0,0 +1,82 @@
+import asyncio
+import logging
+
+import pytest
+import pytest_asyncio
+
+from supervisorio.infrastructure.CW import CheckWeigher
+from supervisorio.simulator.server import DeviceProfile, SimulatedCheckWeigher, serve
+
+BASE_PORT = 15320
+logger = logging.getLogger(__name__)  # sem arquivo de log por equipamento de teste
+
+
+async def run_listeners(cws, seconds):
+    tasks = [asyncio.create_task(cw.listener()) for cw in cws]
+    await asyncio.sleep(seconds)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    for cw in cws:
+        cw.close()
+
+
+@pytest_asyncio.fixture
+async def simulator():
+    devices = [SimulatedCheckWeigher(1), SimulatedCheckWeigher(2, DeviceProfile(slow_rate=1.0, slow_delay=0.5))]
+    task = asyncio.create_task(serve(devices, base_port=BASE_PORT))
+    await asyncio.sleep(0.2)
+    yield devices
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+def make_cw(index: int) -> CheckWeigher:
+    return CheckWeigher(f'TEST{index}', '127.0.0.1', BASE_PORT + index, str(index + 1),
+                        poll_interval=0.01, timeout=2.0, logger=logger)
+
+
+@pytest.mark.asyncio
+async def test_listener_dispatches_weight_read(simulator):
+    simulator[0].weigh(512, classification=2)
+    received = []
+
+    async def handler(payload):
+        received.append(payload)
+
+    cw = make_cw(0).on(CheckWeigher.eventTypes.WEIGHT_READ, handler)
+    await run_listeners([cw], 0.3)
+
+    assert len(received) == 1, 'Should dispatch only once per operation_id'
+    assert received[0].weight == 512
+    assert received[0].classification == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_device_does_not_block_other_devices(simulator):
+    fast, slow = make_cw(0), make_cw(1)
+
+    await run_listeners([fast, slow], 1.0)
+
+    assert fast.metrics.reads_success > 20
+    assert slow.metrics.reads_success <= 2
+
+
+def test_unchanged_registers_skip_decoding():
+    cw = make_cw(0)
+    registers = [1, 520, 2, 60, 0, 0, 0, 0, 0, 0, 42]
+
+    assert not cw.unchanged([list(registers)])
+    payload = cw.dumps([registers])
+
+    assert cw.unchanged([list(registers)]), 'Identical block should hit the fast path'
+    assert cw.unchanged([list(registers)])
+    assert cw.payload is payload
+    assert cw.unchanged_reads == 2
+    assert cw.realtime['timestamp'] == payload.timestamp
+    assert (cw.realtime['seen'], cw.realtime['unchanged_reads']) == (3, 2), \
+        'realtime should report that the unchanged state is still being confirmed'
+
+    registers[10] = 43
+    assert not cw.unchanged([registers])
+    assert cw.unchanged_reads == 0
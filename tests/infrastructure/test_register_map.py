@@ -0,0 +1,57 @@
+import struct
+import pytest
+
+from supervisorio.infrastructure.CW import DEFAULT_REGISTER_MAP, PAYLOAD_FIELDS
+from supervisorio.infrastructure.register_map import RegisterField, RegisterMap, plan_reads
+
+
+def test_plan_reads_merges_near_fields_into_one_block():
+    blocks = plan_reads([RegisterField('a', 100), RegisterField('b', 105),
+                         RegisterField('c', 200)], max_gap=8)
+
+    assert [(b.address, b.count) for b in blocks] == [(100, 6), (200, 1)]
+
+
+def test_plan_reads_respects_modbus_limit():
+    fields = [RegisterField(f'f{i}', 1000 + i * 10, 'uint32') for i in range(30)]
+
+    blocks = plan_reads(fields, max_gap=10)
+
+    assert len(blocks) > 1
+    assert all(b.count <= 125 for b in blocks)
+
+
+def test_plan_reads_rejects_overlapping_fields():
+    with pytest.raises(ValueError):
+        plan_reads([RegisterField('a', 10, 'uint32'), RegisterField('b', 11)])
+
+
+def test_decode_multi_register_types():
+    register_map = RegisterMap('test', [
+        RegisterField('counter', 10, 'uint32'),
+        RegisterField('swapped', 12, 'uint32', word_order='little'),
+        RegisterField('signed', 20, 'int16'),
+        RegisterField('ratio', 22, 'float32'),
+    ])
+    ratio = struct.unpack('>2H', struct.pack('>f', 1.5))
+
+    registers = [0x0001, 0x0002, 0x0002, 0x0001] + [0] * 6 + [0xFFFF, 0, *ratio]
+
+    assert len(register_map.blocks) == 1
+    assert register_map.decode([registers]) == (0x00010002, 0x00010002, -1, 1.5)
+
+
+def test_default_map_matches_legacy_layout():
+    registers = [1, 520, 2, 60, 0, 0, 0, 5, 0, 0, 42]
+
+    values = DEFAULT_REGISTER_MAP.decode([registers])
+
+    assert dict(zip(PAYLOAD_FIELDS, values)) == {
+        'operation_type': 1, 'weight': 520, 'classification': 2,
+        'ppm': 60, 'reason': 5, 'operation_id': 42}
+    assert [(b.address, b.count) for b in DEFAULT_REGISTER_MAP.blocks] == [(30720, 11)]
+
+
+def test_missing_payload_field_is_rejected():
+    with pytest.raises(ValueError):
+        RegisterMap('test', [RegisterField('weight', 1)], output=PAYLOAD_FIELDS)
@@ -0,0 +1,62 @@
+import pytest
+from asyncpg.exceptions import FeatureNotSupportedError
+
+from supervisorio.infrastructure.database.repositories import PesagemRepository
+
+
+class FakeConnection:
+    def __init__(self, copy_error: Exception | None = None):
+        self.copy_error = copy_error
+        self.copied = []
+        self.executed = []
+
+    async def copy_records_to_table(self, table, records, columns):
+        if self.copy_error:
+            raise self.copy_error
+        self.copied.append((table, records, columns))
+
+    async def executemany(self, query, records):
+        self.executed.append((query, records))
+
+
+class CopyRepository(PesagemRepository):
+    insert_mode = 'copy'
+
+
+ROWS = [('1', 500, 0, None), ('2', 510, 1, None)]
+
+
+@pytest.mark.asyncio
+async def test_write_uses_binary_copy():
+    conn = FakeConnection()
+
+    await CopyRepository.write(conn, ROWS)
+
+    assert conn.copied == [('pesagens', ROWS, PesagemRepository.columns)]
+    assert conn.executed == []
+
+
+@pytest.mark.asyncio
+async def test_write_falls_back_to_executemany_when_copy_is_unsupported():
+    class Repository(CopyRepository):
+        pass
+
+    conn = FakeConnection(copy_error=FeatureNotSupportedError('COPY não suportado'))
+
+    await Repository.write(conn, ROWS)
+
+    assert conn.executed == [(
+        'INSERT INTO pesagens (maquina_id, peso, classificacao, timestamp) VALUES ($1, $2, $3, $4)',
+        ROWS)]
+    assert Repository.insert_mode == 'executemany', 'Should stop trying COPY'
+    assert CopyRepository.insert_mode == 'copy'
+
+
+@pytest.mark.asyncio
+async def test_write_mode_overrides_repository_mode():
+    conn = FakeConnection()
+
+    await CopyRepository.write(conn, ROWS, mode='executemany')
+
+    assert conn.copied == []
+    assert len(conn.executed) == 1
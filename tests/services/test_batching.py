@@ -0,0 +1,42 @@
+from supervisorio.services.batching import BatchController
+
+
+def feed(controller, batches, size, latency, depth=0, period=1.0):
+    now = 0.0
+    for _ in range(batches):
+        now += period
+        controller.update(size, latency, depth, now)
+
+
+def test_low_traffic_lingers_to_bound_round_trips():
+    controller = BatchController(max_round_trips=10, max_linger=0.5)
+
+    feed(controller, 10, size=2, latency=0.005)
+
+    assert controller.batch_size == 1
+    assert 0 < controller.linger <= 0.1
+
+
+def test_batch_grows_with_arrival_rate():
+    controller = BatchController(max_round_trips=10, max_size=5_000)
+
+    feed(controller, 20, size=1_000, latency=0.05, period=0.1)  # 10.000 itens/s
+
+    assert controller.batch_size == 1_000
+
+
+def test_backlog_drains_without_linger():
+    controller = BatchController(max_size=5_000)
+
+    feed(controller, 5, size=500, latency=0.05, depth=3_000)
+
+    assert controller.batch_size >= 3_000
+    assert controller.linger == 0
+
+
+def test_batch_size_is_limited_by_latency_slo():
+    controller = BatchController(max_size=50_000, latency_slo=1.0)
+
+    feed(controller, 5, size=1_000, latency=0.1, depth=40_000)  # 0,1 ms por linha
+
+    assert controller.batch_size == 5_000, 'Insert estimate should fit in half of the SLO'
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+
+import pytest
+
+from supervisorio.core.types.metrics import Metrics
+from supervisorio.services.scheduler import AdaptiveRate, PollScheduler
+
+
+class FakeDevice:
+    def __init__(self, name: str, interval: float, latency: float):
+        self.name = name
+        self.poll_interval = interval
+        self.min_poll_interval = interval
+        self.max_poll_interval = interval
+        self.latency = latency
+        self.metrics = Metrics()
+        self.polls = 0
+        self.logger = logging.getLogger(__name__)
+        self.handlers = []
+
+    async def dispatch(self, event, *args):
+        for handler in self.handlers:
+            await handler(*args)
+
+    async def poll(self):
+        self.polls += 1
+        await asyncio.sleep(self.latency)
+        return 0
+
+
+def test_adaptive_rate_speeds_up_while_weighing():
+    rate = AdaptiveRate(0.1, min_interval=0.01, max_interval=1.0)
+
+    for i in range(5):
+        interval = rate.update(1, now=i * 0.05)
+
+    assert interval == pytest.approx(0.05 / 3)
+
+
+def test_adaptive_rate_slows_down_when_idle():
+    rate = AdaptiveRate(0.1, min_interval=0.01, max_interval=1.0)
+
+    for i in range(50):
+        interval = rate.update(0, now=i * 0.5)
+
+    assert interval == 1.0
+
+
+def test_adaptive_rate_missed_operations_jump_to_min_interval():
+    rate = AdaptiveRate(0.5, min_interval=0.02, max_interval=1.0)
+
+    assert rate.update(3, now=1.0) == 0.02
+
+
+@pytest.mark.asyncio
+async def test_scheduler_does_not_drift_with_read_latency():
+    device = FakeDevice("fake", interval=0.05, latency=0.02)
+    task = asyncio.create_task(PollScheduler([device], jitter=0).run())  # type: ignore
+
+    await asyncio.sleep(1.0)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    # Loop com sleep faria ~1 / (0.05 + 0.02) = 14 leituras
+    assert device.polls >= 18
+    assert device.metrics.deadlines_missed == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_records_missed_deadlines():
+    device = FakeDevice("slow", interval=0.05, latency=0.12)
+    task = asyncio.create_task(PollScheduler([device], jitter=0).run())  # type: ignore
+
+    await asyncio.sleep(0.6)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert device.metrics.deadlines_missed >= 4
+
+
+class FailingDevice(FakeDevice):
+    async def poll(self):
+        self.polls += 1
+        raise ValueError('falha de leitura')
+
+
+@pytest.mark.asyncio
+async def test_scheduler_keeps_polling_when_poll_and_error_handler_fail():
+    errors = []
+    device = FailingDevice("fake", interval=0.02, latency=0)
+    device.handlers.append(errors.append)  # handler síncrono: o await do dispatch falha
+    task = asyncio.create_task(PollScheduler([device], jitter=0).run())  # type: ignore
+
+    await asyncio.sleep(1.5)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert device.polls >= 2, 'Device should be rescheduled after the failure'
+    assert len(errors) == device.polls
+    assert device.metrics.reads_error == device.polls
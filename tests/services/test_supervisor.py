@@ -0,0 +1,54 @@
+import sys
+import time
+
+from supervisorio.services.supervisor import ProcessSupervisor
+
+
+def crash():
+    sys.exit(1)
+
+
+def finish():
+    pass
+
+
+def wait_exit(supervisor: ProcessSupervisor):
+    for child in supervisor.children:
+        child.process.join(5)  # type: ignore
+
+
+def test_supervisor_restarts_crashed_process():
+    supervisor = ProcessSupervisor(restart_delay=0)
+    child = supervisor.add("crash", crash)
+
+    supervisor.start()
+    wait_exit(supervisor)
+    supervisor.check()
+
+    assert child.restarts == 1, 'Crashed process should be restarted'
+    supervisor.stop()
+
+
+def test_supervisor_does_not_restart_clean_exit():
+    supervisor = ProcessSupervisor(restart_delay=0)
+    child = supervisor.add("finish", finish)
+
+    supervisor.start()
+    wait_exit(supervisor)
+    supervisor.check()
+
+    assert child.restarts == 0
+    assert not supervisor.alive()
+
+
+def test_supervisor_backoff_delays_restart():
+    supervisor = ProcessSupervisor(restart_delay=60)
+    child = supervisor.add("crash", crash)
+
+    supervisor.start()
+    wait_exit(supervisor)
+    supervisor.check()
+
+    assert child.restarts == 0, 'Restart should wait for the backoff delay'
+    assert child.restart_at > time.monotonic()
+    supervisor.stop()
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from supervisorio.core.buffer import Buffer
+from supervisorio.core.spool import DiskSpool
+from supervisorio.services.batching import BatchController
+from supervisorio.services.worker import WriterPool, worker
+
+
+class FlakyRepository:
+    """Repositório fora do ar nas primeiras `failures` chamadas"""
+    failures = 0
+    stored: list = []
+
+    @classmethod
+    async def insert_many(cls, batch):
+        if cls.failures:
+            cls.failures -= 1
+            raise ConnectionRefusedError('banco indisponível')
+        cls.stored.extend(batch)
+
+
+@pytest.mark.asyncio
+async def test_worker_keeps_batch_while_database_is_down(tmp_path):
+    FlakyRepository.failures = 2
+    FlakyRepository.stored = []
+    buffer = Buffer(maxsize=5, spool=DiskSpool(tmp_path))
+
+    task = asyncio.create_task(worker(buffer, FlakyRepository, 'teste'))  # type: ignore
+    for i in range(50):
+        await buffer.put(i)  # com o banco fora, o excedente vai para o disco
+
+    while len(FlakyRepository.stored) < 50:
+        await asyncio.sleep(0.05)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert FlakyRepository.stored == list(range(50))
+    assert buffer.spooled() == 0
+
+
+class MemoryRepository:
+    stored: list = []
+
+    @classmethod
+    async def insert_many(cls, batch):
+        cls.stored.extend(batch)
+
+
+@pytest.mark.asyncio
+async def test_worker_cancelled_while_lingering_flushes_partial_batch():
+    MemoryRepository.stored = []
+    buffer = Buffer()
+    task = asyncio.create_task(worker(buffer, MemoryRepository, 'teste',  # type: ignore
+                                      controller=BatchController(max_linger=0.5)))
+    for i in range(3):
+        await buffer.put(i)
+    await asyncio.sleep(0.05)  # worker aguardando mais itens (linger)
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert MemoryRepository.stored == [0, 1, 2]
+    assert buffer.qsize() == 0
+
+
+class SlowRepository:
+    """Repositório com inserts lentos: mede a concorrência atingida"""
+    active = 0
+    peak = 0
+    stored: list = []
+
+    @classmethod
+    async def insert_many(cls, batch):
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        try:
+            await asyncio.sleep(0.05)
+            cls.stored.extend(batch)
+        finally:
+            cls.active -= 1
+
+
+class RecordingBuffer(Buffer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.acks = 0
+
+    def ack(self):
+        self.acks += 1
+        super().ack()
+
+
+@pytest.mark.asyncio
+async def test_writer_pool_inserts_batches_concurrently():
+    SlowRepository.peak = 0
+    SlowRepository.stored = []
+    buffer = Buffer(maxsize=1_000)
+    for i in range(400):
+        await buffer.put(i)
+
+    pool = WriterPool(buffer, SlowRepository, 'teste', writers=4,  # type: ignore
+                      controller=BatchController(max_size=50, max_linger=0))
+    task = asyncio.create_task(pool.run())
+    while len(SlowRepository.stored) < 400:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert SlowRepository.peak == 4
+    assert sorted(SlowRepository.stored) == list(range(400))
+
+
+def test_writer_pool_acks_in_delivery_order():
+    buffer = RecordingBuffer()
+    pool = WriterPool(buffer, SlowRepository, 'teste', writers=3)  # type: ignore
+    first, second, third = (pool._hold([i]) for i in range(3))
+
+    pool._settle(third)
+    pool._settle(second)
+    assert buffer.acks == 0, 'Should wait for the oldest batch'
+    assert pool.pending_acks == 2
+
+    pool._settle(first)
+    assert buffer.acks == 3
+    assert pool.pending_acks == 0
+
+
+@pytest.mark.asyncio
+async def test_writer_pool_flushes_in_flight_batches_on_cancel():
+    SlowRepository.stored = []
+    buffer = Buffer(maxsize=1_000)
+    for i in range(100):
+        await buffer.put(i)
+
+    pool = WriterPool(buffer, SlowRepository, 'teste', writers=2,  # type: ignore
+                      controller=BatchController(max_size=10, max_linger=0))
+    task = asyncio.create_task(pool.run())
+    await asyncio.sleep(0.01)  # inserts em andamento
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert sorted(SlowRepository.stored) == list(range(100))
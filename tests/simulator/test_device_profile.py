@@ -0,0 +1,28 @@
+from supervisorio.simulator.server import DeviceProfile
+
+
+def test_state_follows_weighing_rate():
+    profile = DeviceProfile(rate=2)
+
+    assert profile.state_at(0.4) == (0, 0, 0), 'No weighing before the first period'
+    assert profile.state_at(1.6) == (3, 1, 0)
+
+
+def test_cycle_alternates_run_and_stop():
+    profile = DeviceProfile(rate=2, run_time=3, stop_time=1)
+
+    assert profile.weighings_per_run == 5
+    assert profile.state_at(2.9) == (5, 1, 0)
+    assert profile.state_at(3.5) == (6, 0, 0), 'Stop should advance the operation_id'
+    assert profile.state_at(4.1) == (6, 0, 0), 'New run keeps the stop state until it weighs'
+    assert profile.state_at(4.6) == (7, 1, 1)
+
+
+def test_weighings_until_matches_state():
+    profile = DeviceProfile(rate=2, run_time=3, stop_time=1)
+
+    weighings = profile.weighings_until(8)
+
+    assert len(weighings) == 10
+    for operation_id, generated in weighings:
+        assert profile.state_at(generated + 0.01)[:2] == (operation_id, 1)